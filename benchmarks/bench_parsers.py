@@ -0,0 +1,45 @@
+"""
+Per-page parse time for each HTML_PARSER backend.
+
+Usage: python benchmarks/bench_parsers.py [rounds]
+"""
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+import run  # noqa: E402
+
+FIXTURES = pathlib.Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "pages"
+
+
+def big_catalog_page(rows: int = 2000) -> str:
+    cards = "".join(
+        f'<div class="card"><h3>Track {i}</h3><p>Production music cue {i} &amp; stems.</p>'
+        f'<a href="/catalog/{i}?utm_source=grid">Listen</a></div>'
+        for i in range(rows)
+    )
+    return f"<html><head><title>Catalog</title></head><body><h1>Music Library</h1>{cards}</body></html>"
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    corpus = [p.read_text(encoding="utf-8") for p in sorted(FIXTURES.glob("*.html"))]
+    corpus.append(big_catalog_page())
+    total_kb = sum(len(h) for h in corpus) / 1024
+    print(f"{len(corpus)} pages, {total_kb:.0f} KB, {rounds} rounds")
+    for name in run.PARSER_BACKENDS:
+        if not run.parser_available(name):
+            print(f"{name:12s} not installed")
+            continue
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for html in corpus:
+                run.PageModel("https://bench.test/", html, parser=name)
+        per_page = (time.perf_counter() - start) / (rounds * len(corpus))
+        print(f"{name:12s} {per_page * 1000:8.2f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Requests/second against a local HTTP fixture server: one-off requests.get
+calls (the old discovery / seed-validation path) vs the shared transport
+from http_transport.build_session, sequential and with 8 threads.
+
+Usage: python benchmarks/bench_transport.py [requests]
+"""
+import gzip
+import pathlib
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+import http_transport  # noqa: E402
+
+PAGE = ("<html><body>" + "<p>production music library catalog</p>" * 400 + "</body></html>").encode()
+PAGE_GZ = gzip.compress(PAGE)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes; without this, Nagle plus
+        # delayed ACKs stall every keep-alive response by ~40 ms.
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        gz = "gzip" in (self.headers.get("Accept-Encoding") or "")
+        body = PAGE_GZ if gz else PAGE
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if gz:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def timed(label: str, n: int, workers: int, get):
+    start = time.perf_counter()
+    if workers == 1:
+        for _ in range(n):
+            get()
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(lambda _: get(), range(n)))
+    elapsed = time.perf_counter() - start
+    print(f"{label:38s} {n / elapsed:8.0f} req/s")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://localhost:{server.server_port}/page"
+
+    timed("requests.get per call", n, 1, lambda: requests.get(url, timeout=10).content)
+    timed("requests.get per call, 8 threads", n, 8, lambda: requests.get(url, timeout=10).content)
+
+    http_transport.install_dns_cache(300)
+    session = http_transport.build_session("bench/1.0", pool_per_host=8)
+    timed("shared transport", n, 1, lambda: session.get(url, timeout=10).content)
+    timed("shared transport, 8 threads", n, 8, lambda: session.get(url, timeout=10).content)
+    print(f"page {len(PAGE)} bytes, {len(PAGE_GZ)} bytes gzipped")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Memory and add/lookup time of the visited-url containers: set[str] versus
+FingerprintSet (VISITED_FINGERPRINTS=1).
+
+Usage: python benchmarks/bench_visited.py [urls]
+"""
+import pathlib
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+import run  # noqa: E402
+
+
+def url(i: int) -> str:
+    return f"https://library{i % 5000}.example.com/catalog/track-{i}?page={i % 37}"
+
+
+def held_bytes(factory, n: int) -> int:
+    # URLs are built inside the traced block, so a set[str] is charged for
+    # the strings it keeps alive while FingerprintSet lets them go.
+    tracemalloc.start()
+    container = factory()
+    for i in range(n):
+        container.add(url(i))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return current
+
+
+def measure(name: str, factory, n: int):
+    held = held_bytes(factory, n)
+    urls = [url(i) for i in range(n)]
+    start = time.perf_counter()
+    container = factory()
+    for u in urls:
+        container.add(u)
+    add_s = time.perf_counter() - start
+    start = time.perf_counter()
+    hits = sum(1 for u in urls if u in container)
+    lookup_s = time.perf_counter() - start
+    assert hits == n
+    print(
+        f"{name:16s} {held / 2**20:7.1f} MB  {held / n:6.1f} B/url  "
+        f"add {add_s / n * 1e6:5.2f} us  lookup {lookup_s / n * 1e6:5.2f} us"
+    )
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{n} urls")
+    measure("set[str]", set, n)
+    measure("FingerprintSet", run.FingerprintSet, n)
+
+
+if __name__ == "__main__":
+    main()
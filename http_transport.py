@@ -0,0 +1,83 @@
+import socket
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+ACCEPT_ENCODING = "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"
+
+_dns_lock = threading.Lock()
+_dns_cache: dict[tuple, tuple[float, list]] = {}
+_dns_ttl = 0.0
+_real_getaddrinfo = socket.getaddrinfo
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    key = (host, port, family, type, proto, flags)
+    now = time.time()
+    with _dns_lock:
+        hit = _dns_cache.get(key)
+        if hit and hit[0] > now:
+            return hit[1]
+    result = _real_getaddrinfo(host, port, family, type, proto, flags)
+    with _dns_lock:
+        _dns_cache[key] = (now + _dns_ttl, result)
+    return result
+
+def install_dns_cache(ttl_seconds: float):
+    """
+    Caches socket.getaddrinfo answers in-process for ttl_seconds, so every
+    connection to an already-seen host skips the resolver. Failed lookups
+    are not cached. A ttl of 0 or less leaves the resolver untouched.
+    """
+    global _dns_ttl
+    if ttl_seconds <= 0:
+        return
+    _dns_ttl = ttl_seconds
+    socket.getaddrinfo = _cached_getaddrinfo
+
+def clear_dns_cache():
+    with _dns_lock:
+        _dns_cache.clear()
+
+def build_session(
+    user_agent: str | None = None,
+    pool_hosts: int = 32,
+    pool_per_host: int = 8,
+    retries: int = 2,
+    backoff: float = 0.5,
+) -> requests.Session:
+    """
+    requests.Session with keep-alive pools sized for concurrent crawling
+    (pool_hosts hosts, pool_per_host connections each), compressed
+    responses and retry with backoff on connection errors only. Read
+    timeouts and HTTP error statuses are returned to the caller as-is.
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=0,
+        status=0,
+        other=0,
+        backoff_factor=backoff,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_per_host, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Accept-Encoding": ACCEPT_ENCODING})
+    if user_agent:
+        session.headers.update({"User-Agent": user_agent})
+    return session
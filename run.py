@@ -1,16 +1,45 @@
 import os
 import re
 import time
+import html as html_lib
 import json
+import atexit
+import heapq
 import hashlib
+import base64
+import threading
+import argparse
+import multiprocessing
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from queue import Empty
 from urllib.parse import urljoin, urlparse, parse_qsl, urlencode
 
 import boto3
 import requests
+from boto3.dynamodb.conditions import Attr
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
+from http_transport import build_session, install_dns_cache
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:
+        SelectolaxParser = None
+
 load_dotenv()
 
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
@@ -21,10 +50,24 @@ DYNAMODB_ENDPOINT_URL = os.getenv("DYNAMODB_ENDPOINT_URL")
 USER_AGENT = os.getenv("USER_AGENT", "MusicLibraryLeadFinder/1.0")
 REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "20"))
 SLEEP_BETWEEN_REQUESTS = float(os.getenv("SLEEP_BETWEEN_REQUESTS", "2.0"))
+RATE_ADAPTIVE = os.getenv("RATE_ADAPTIVE", "1").strip() == "1"
+RATE_MIN_DELAY = float(os.getenv("RATE_MIN_DELAY", "1.0"))
+RATE_MAX_DELAY = float(os.getenv("RATE_MAX_DELAY", "30"))
+RATE_DECREASE_STEP = float(os.getenv("RATE_DECREASE_STEP", "0.25"))
+RATE_BACKOFF_FACTOR = float(os.getenv("RATE_BACKOFF_FACTOR", "2.0"))
+RATE_SLOW_SECONDS = float(os.getenv("RATE_SLOW_SECONDS", "3.0"))
 MAX_PAGES_PER_RUN = int(os.getenv("MAX_PAGES_PER_RUN", "60"))
 MAX_LEADS_PER_RUN = int(os.getenv("MAX_LEADS_PER_RUN", "0"))
 MAX_PAGES_PER_DOMAIN = int(os.getenv("MAX_PAGES_PER_DOMAIN", "10"))
 MAX_LINKS_PER_PAGE = int(os.getenv("MAX_LINKS_PER_PAGE", "40"))
+CRAWL_CONCURRENCY = int(os.getenv("CRAWL_CONCURRENCY", "1"))
+CRAWL_PROCESSES = int(os.getenv("CRAWL_PROCESSES", "0"))
+HTTP_POOL_HOSTS = int(os.getenv("HTTP_POOL_HOSTS", "32"))
+HTTP_POOL_PER_HOST = int(os.getenv("HTTP_POOL_PER_HOST", str(max(8, CRAWL_CONCURRENCY))))
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "2"))
+HTTP_BACKOFF = float(os.getenv("HTTP_BACKOFF", "0.5"))
+DNS_CACHE_TTL_SECONDS = float(os.getenv("DNS_CACHE_TTL_SECONDS", "300"))
+HTML_PARSER = os.getenv("HTML_PARSER", "html.parser").strip().lower()
 ALLOW_EXTERNAL_DOMAINS = os.getenv("ALLOW_EXTERNAL_DOMAINS", "false").lower() in ("1", "true", "yes")
 EXPORT_LEADS_FILE = os.getenv("EXPORT_LEADS_FILE", "").strip()
 REQUIRE_SAME_DOMAIN_FORM = os.getenv("REQUIRE_SAME_DOMAIN_FORM", "1").strip() == "1"
@@ -35,6 +78,27 @@ MIN_LIBRARY_CONFIDENCE = int(os.getenv("MIN_LIBRARY_CONFIDENCE", "60"))
 VISITED_CACHE_ENABLED = os.getenv("VISITED_CACHE_ENABLED", "1").strip() == "1"
 VISITED_CACHE_TABLE = os.getenv("VISITED_CACHE_TABLE", PAGES_TABLE)
 VISITED_CACHE_TTL_HOURS = float(os.getenv("VISITED_CACHE_TTL_HOURS", "0"))
+VISITED_LRU_SIZE = int(os.getenv("VISITED_LRU_SIZE", "50000"))
+VISITED_LRU_MISS_SECONDS = float(os.getenv("VISITED_LRU_MISS_SECONDS", "300"))
+VISITED_FINGERPRINTS = os.getenv("VISITED_FINGERPRINTS", "1").strip() == "1"
+
+MAX_PAGE_BYTES = int(os.getenv("MAX_PAGE_BYTES", "2000000"))
+
+NEGATIVE_CACHE_TTL_HOURS = float(os.getenv("NEGATIVE_CACHE_TTL_HOURS", "168"))
+NEGATIVE_CACHE_FILE = os.getenv("NEGATIVE_CACHE_FILE", "negative_cache.json").strip()
+CIRCUIT_BREAKER_FAILURES = int(os.getenv("CIRCUIT_BREAKER_FAILURES", "3"))
+
+CHECKPOINT_FILE = os.getenv("CHECKPOINT_FILE", "crawl_checkpoint.json").strip()
+CHECKPOINT_EVERY_PAGES = int(os.getenv("CHECKPOINT_EVERY_PAGES", "25"))
+
+CONTACT_CACHE_TTL_HOURS = float(os.getenv("CONTACT_CACHE_TTL_HOURS", "24"))
+CONTACT_CACHE_FILE = os.getenv("CONTACT_CACHE_FILE", "").strip()
+CONTACT_PROBE_CONCURRENCY = int(os.getenv("CONTACT_PROBE_CONCURRENCY", "1"))
+
+PAGE_LOG_WRITE_BEHIND = os.getenv("PAGE_LOG_WRITE_BEHIND", "1").strip() == "1"
+PAGE_LOG_BATCH_SIZE = int(os.getenv("PAGE_LOG_BATCH_SIZE", "25"))
+PAGE_LOG_FLUSH_SECONDS = float(os.getenv("PAGE_LOG_FLUSH_SECONDS", "5"))
+PAGE_LOG_MAX_BUFFER = int(os.getenv("PAGE_LOG_MAX_BUFFER", "2000"))
 
 DISCOVERY_ENABLED = os.getenv("DISCOVERY_ENABLED", "0").strip() == "1"
 DISCOVERY_PROVIDER = os.getenv("DISCOVERY_PROVIDER", "brave").strip().lower()
@@ -62,9 +126,13 @@ SQS_MAX_MESSAGES = int(os.getenv("SQS_MAX_MESSAGES", "5"))
 SQS_WAIT_SECONDS = int(os.getenv("SQS_WAIT_SECONDS", "10"))
 SQS_VISIBILITY_TIMEOUT = int(os.getenv("SQS_VISIBILITY_TIMEOUT", "30"))
 SQS_MESSAGE_GROUP_ID = os.getenv("SQS_MESSAGE_GROUP_ID", "leadbot").strip()
+SQS_HEARTBEAT_SECONDS = float(os.getenv("SQS_HEARTBEAT_SECONDS", str(max(1, SQS_VISIBILITY_TIMEOUT // 2))))
 SKIP_CONTACTED_DOMAINS = os.getenv("SKIP_CONTACTED_DOMAINS", "1").strip() == "1"
 DEDUPE_BY_DOMAIN = os.getenv("DEDUPE_BY_DOMAIN", "0").strip() == "1"
 DEDUPE_FOR_FORMS = os.getenv("DEDUPE_FOR_FORMS", "1").strip() == "1"
+SUPPRESSION_INDEX_ENABLED = os.getenv("SUPPRESSION_INDEX_ENABLED", "1").strip() == "1"
+SUPPRESSION_SCAN_SEGMENTS = int(os.getenv("SUPPRESSION_SCAN_SEGMENTS", "4"))
+SUPPRESSION_REFRESH_SECONDS = float(os.getenv("SUPPRESSION_REFRESH_SECONDS", "900"))
 
 dynamodb = boto3.resource(
     "dynamodb",
@@ -79,20 +147,62 @@ def queue_enabled() -> bool:
     return QUEUE_ENABLED and bool(SQS_QUEUE_URL)
 
 class SqsQueue:
+    """
+    SQS frontier. send() buffers messages locally and ships them with
+    send_message_batch (10 per call); call flush() before relying on them
+    being visible. delete_batch() removes processed messages 10 at a time.
+    """
+
+    BATCH_SIZE = 10
+
     def __init__(self, queue_url: str):
         self.queue_url = queue_url
         self.client = boto3.client("sqs", region_name=AWS_REGION)
         self.is_fifo = queue_url.endswith(".fifo")
+        self.lock = threading.Lock()
+        self.outbox: list[dict] = []
+        self.requests = 0
 
-    def send(self, url: str, seed_url: str):
+    def _entry(self, url: str, seed_url: str) -> dict:
         body = json.dumps({"url": url, "seed_url": seed_url})
-        params = {"QueueUrl": self.queue_url, "MessageBody": body}
+        entry = {"MessageBody": body}
         if self.is_fifo:
-            params["MessageGroupId"] = SQS_MESSAGE_GROUP_ID or "leadbot"
-            params["MessageDeduplicationId"] = sha_id(body)
-        self.client.send_message(**params)
+            entry["MessageGroupId"] = SQS_MESSAGE_GROUP_ID or "leadbot"
+            entry["MessageDeduplicationId"] = sha_id(body)
+        return entry
+
+    def send(self, url: str, seed_url: str):
+        with self.lock:
+            self.outbox.append(self._entry(url, seed_url))
+            if len(self.outbox) < self.BATCH_SIZE:
+                return
+            batch, self.outbox = self.outbox, []
+        self._send_batch(batch)
+
+    def flush(self):
+        with self.lock:
+            batch, self.outbox = self.outbox, []
+        for i in range(0, len(batch), self.BATCH_SIZE):
+            self._send_batch(batch[i:i + self.BATCH_SIZE])
+
+    def _send_batch(self, batch: list[dict]):
+        entries = [dict(e, Id=str(i)) for i, e in enumerate(batch)]
+        for _ in range(2):
+            if not entries:
+                return
+            try:
+                self.requests += 1
+                resp = self.client.send_message_batch(QueueUrl=self.queue_url, Entries=entries)
+            except Exception as e:
+                print(f"SQS send batch failed: {e}")
+                continue
+            failed = {f["Id"] for f in resp.get("Failed", [])}
+            entries = [e for e in entries if e["Id"] in failed]
+        if entries:
+            print(f"SQS dropped {len(entries)} messages after retry")
 
     def receive(self) -> list[dict]:
+        self.requests += 1
         resp = self.client.receive_message(
             QueueUrl=self.queue_url,
             MaxNumberOfMessages=SQS_MAX_MESSAGES,
@@ -102,16 +212,110 @@ class SqsQueue:
         return resp.get("Messages", [])
 
     def delete(self, receipt_handle: str):
-        self.client.delete_message(
-            QueueUrl=self.queue_url,
-            ReceiptHandle=receipt_handle,
+        self.delete_batch([receipt_handle])
+
+    def delete_batch(self, receipt_handles: list[str]):
+        for i in range(0, len(receipt_handles), self.BATCH_SIZE):
+            chunk = receipt_handles[i:i + self.BATCH_SIZE]
+            entries = [{"Id": str(n), "ReceiptHandle": r} for n, r in enumerate(chunk)]
+            try:
+                self.requests += 1
+                resp = self.client.delete_message_batch(QueueUrl=self.queue_url, Entries=entries)
+            except Exception as e:
+                print(f"SQS delete batch failed: {e}")
+                continue
+            if resp.get("Failed"):
+                print(f"SQS failed to delete {len(resp['Failed'])} messages")
+
+    def change_visibility_batch(self, receipt_handles: list[str], timeout: int):
+        for i in range(0, len(receipt_handles), self.BATCH_SIZE):
+            chunk = receipt_handles[i:i + self.BATCH_SIZE]
+            entries = [
+                {"Id": str(n), "ReceiptHandle": r, "VisibilityTimeout": timeout}
+                for n, r in enumerate(chunk)
+            ]
+            try:
+                self.requests += 1
+                self.client.change_message_visibility_batch(QueueUrl=self.queue_url, Entries=entries)
+            except Exception as e:
+                print(f"SQS change visibility failed: {e}")
+
+class VisibilityHeartbeat:
+    """
+    Keeps received-but-unfinished SQS messages invisible while they wait or
+    are crawled. Every SQS_HEARTBEAT_SECONDS a background thread resets the
+    visibility of all tracked messages to SQS_VISIBILITY_TIMEOUT in batches.
+    release() hands untouched messages straight back to the queue.
+    """
+
+    def __init__(self, queue: SqsQueue):
+        self.queue = queue
+        self.lock = threading.Lock()
+        self.in_flight: dict[str, float] = {}
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="sqs-heartbeat", daemon=True)
+        self.stats = {"extensions": 0, "redeliveries_avoided": 0, "released": 0}
+
+    def start(self):
+        self.thread.start()
+
+    def track(self, msgs: list[dict]) -> list[dict]:
+        now = time.time()
+        with self.lock:
+            for msg in msgs:
+                if msg.get("ReceiptHandle"):
+                    self.in_flight[msg["ReceiptHandle"]] = now
+        return msgs
+
+    def finish(self, receipt_handle: str):
+        with self.lock:
+            received_at = self.in_flight.pop(receipt_handle, None)
+        if received_at is not None and time.time() - received_at > SQS_VISIBILITY_TIMEOUT:
+            self.stats["redeliveries_avoided"] += 1
+
+    def _run(self):
+        while not self.stop_event.wait(SQS_HEARTBEAT_SECONDS):
+            with self.lock:
+                receipts = list(self.in_flight)
+            if receipts:
+                self.queue.change_visibility_batch(receipts, SQS_VISIBILITY_TIMEOUT)
+                self.stats["extensions"] += len(receipts)
+
+    def release(self):
+        with self.lock:
+            receipts = list(self.in_flight)
+            self.in_flight.clear()
+        if receipts:
+            self.queue.change_visibility_batch(receipts, 0)
+            self.stats["released"] += len(receipts)
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread.is_alive():
+            self.thread.join()
+        self.release()
+
+    def summary(self) -> str:
+        st = self.stats
+        return (
+            f"SQS heartbeat: {st['extensions']} visibility extensions, "
+            f"{st['redeliveries_avoided']} redeliveries avoided, {st['released']} messages released."
         )
 
-session = requests.Session()
-session.headers.update({"User-Agent": USER_AGENT})
+install_dns_cache(DNS_CACHE_TTL_SECONDS)
+session = build_session(
+    USER_AGENT,
+    pool_hosts=HTTP_POOL_HOSTS,
+    pool_per_host=HTTP_POOL_PER_HOST,
+    retries=HTTP_RETRIES,
+    backoff=HTTP_BACKOFF,
+)
 
 DOMAIN_LAST_REQUEST = {}
 DOMAIN_PAGES = {}
+# Guards the shared crawl state above plus visited / leads_seen when
+# CRAWL_CONCURRENCY > 1 runs crawl_one on several threads.
+STATE_LOCK = threading.Lock()
 
 def utc_now() -> datetime:
     return datetime.now(timezone.utc)
@@ -337,7 +541,109 @@ COMMON_CONTACT_PATHS = (
     "/management",
 )
 
+class PageLogBuffer:
+    """
+    Write-behind buffer for pages_table records. fetch hands records to
+    add() and moves on; a background thread writes them with batch_writer
+    once PAGE_LOG_BATCH_SIZE records are waiting or PAGE_LOG_FLUSH_SECONDS
+    have passed. close() (also registered with atexit) flushes whatever is
+    left. A failed batch is retried once and then dropped.
+    """
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.items: list[dict] = []
+        self.thread = None
+        self.closed = False
+        self.stats = {
+            "written": 0,
+            "flushes": 0,
+            "flush_seconds": 0.0,
+            "max_flush_seconds": 0.0,
+            "retried": 0,
+            "dropped": 0,
+        }
+
+    def add(self, item: dict):
+        with self.cond:
+            if self.thread is None and not self.closed:
+                self.thread = threading.Thread(target=self._run, name="page-log", daemon=True)
+                self.thread.start()
+            self.items.append(item)
+            overflow = len(self.items) - PAGE_LOG_MAX_BUFFER
+            if overflow > 0:
+                del self.items[:overflow]
+                self.stats["dropped"] += overflow
+            if len(self.items) >= PAGE_LOG_BATCH_SIZE:
+                self.cond.notify()
+
+    def _take(self) -> list[dict]:
+        batch, self.items = self.items, []
+        return batch
+
+    def _run(self):
+        while True:
+            with self.cond:
+                if not self.closed and len(self.items) < PAGE_LOG_BATCH_SIZE:
+                    self.cond.wait(PAGE_LOG_FLUSH_SECONDS)
+                batch = self._take()
+                closed = self.closed
+            if batch:
+                self._write(batch)
+            if closed:
+                return
+
+    def _write(self, batch: list[dict]):
+        start = time.time()
+        for attempt in range(2):
+            try:
+                with pages_table.batch_writer(overwrite_by_pkeys=["page_url"]) as writer:
+                    for item in batch:
+                        writer.put_item(Item=item)
+                self.stats["written"] += len(batch)
+                break
+            except Exception as e:
+                if attempt == 0:
+                    self.stats["retried"] += len(batch)
+                    continue
+                self.stats["dropped"] += len(batch)
+                print(f"DynamoDB pages_table batch write failed: {e}")
+        elapsed = time.time() - start
+        self.stats["flushes"] += 1
+        self.stats["flush_seconds"] += elapsed
+        self.stats["max_flush_seconds"] = max(self.stats["max_flush_seconds"], elapsed)
+
+    def close(self):
+        with self.cond:
+            if self.closed:
+                return
+            self.closed = True
+            thread = self.thread
+            self.cond.notify()
+        if thread:
+            thread.join()
+        else:
+            batch = self._take()
+            if batch:
+                self._write(batch)
+
+    def summary(self) -> str:
+        st = self.stats
+        avg_ms = (st["flush_seconds"] / st["flushes"] * 1000.0) if st["flushes"] else 0.0
+        return (
+            f"Page log: wrote {st['written']} records in {st['flushes']} flushes "
+            f"(avg {avg_ms:.0f} ms, max {st['max_flush_seconds'] * 1000.0:.0f} ms), "
+            f"retried {st['retried']}, dropped {st['dropped']}."
+        )
+
+PAGE_LOG = PageLogBuffer()
+atexit.register(PAGE_LOG.close)
+
 def safe_put_pages(item: dict):
+    VISITED_CACHE.record(item)
+    if PAGE_LOG_WRITE_BEHIND:
+        PAGE_LOG.add(item)
+        return
     try:
         pages_table.put_item(Item=item)
     except Exception as e:
@@ -386,7 +692,93 @@ def append_lead_export(item: dict):
     except Exception as e:
         print(f"Lead export failed: {e}")
 
+SUPPRESSED_STATUSES = ("skipped", "contacted")
+
+def lead_fingerprint(lead_id: str) -> int:
+    return int.from_bytes(hashlib.blake2b(lead_id.encode("utf-8"), digest_size=8).digest(), "big")
+
+class SuppressionIndex:
+    """
+    64-bit fingerprints of every lead_id whose status is skipped or
+    contacted, domain_suppression records included. Loaded once with a
+    parallel scan and refreshed every SUPPRESSION_REFRESH_SECONDS from
+    records touched since the last load. A fingerprint hit is only a
+    possible positive and is confirmed with lookup_lead_skipped; a miss is
+    answered without touching DynamoDB.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.fingerprints: set[int] = set()
+        self.ready = False
+        self.loaded_at = 0.0
+        self.since = ""
+
+    def _scan_segment(self, segment: int, total: int, filter_expr) -> list[str]:
+        ids = []
+        kwargs = {
+            "ProjectionExpression": "lead_id",
+            "FilterExpression": filter_expr,
+            "Segment": segment,
+            "TotalSegments": total,
+        }
+        while True:
+            resp = leads_table.scan(**kwargs)
+            ids.extend(item["lead_id"] for item in resp.get("Items", []) if item.get("lead_id"))
+            start_key = resp.get("LastEvaluatedKey")
+            if not start_key:
+                return ids
+            kwargs["ExclusiveStartKey"] = start_key
+
+    def load(self, since: str = "") -> bool:
+        filter_expr = Attr("status").is_in(list(SUPPRESSED_STATUSES))
+        if since:
+            filter_expr = filter_expr & Attr("touched_at").gt(since)
+        started = time.time()
+        total = max(1, SUPPRESSION_SCAN_SEGMENTS)
+        try:
+            with ThreadPoolExecutor(max_workers=total) as pool:
+                parts = list(pool.map(lambda seg: self._scan_segment(seg, total, filter_expr), range(total)))
+        except Exception as e:
+            print(f"Suppression index load failed: {e}")
+            return False
+        with self.lock:
+            for ids in parts:
+                self.fingerprints.update(lead_fingerprint(i) for i in ids)
+            self.ready = True
+            self.loaded_at = started
+            # Small overlap so records touched during the scan are picked up next time.
+            self.since = datetime.fromtimestamp(started - 60, timezone.utc).isoformat()
+        return True
+
+    def maybe_refresh(self):
+        if not self.ready or SUPPRESSION_REFRESH_SECONDS <= 0:
+            return
+        with self.lock:
+            due = time.time() - self.loaded_at >= SUPPRESSION_REFRESH_SECONDS
+            if due:
+                # Claim the refresh so concurrent callers don't all rescan.
+                self.loaded_at = time.time()
+        if due:
+            self.load(since=self.since)
+
+    def might_be_suppressed(self, lead_id: str, lead_domain: str | None = None) -> bool:
+        if lead_fingerprint(lead_id) in self.fingerprints:
+            return True
+        if SKIP_CONTACTED_DOMAINS and lead_domain:
+            return lead_fingerprint(sha_id(f"domain:{lead_domain}")) in self.fingerprints
+        return False
+
+SUPPRESSION_INDEX = SuppressionIndex()
+
 def is_lead_skipped(lead_id: str, lead_domain: str | None = None) -> bool:
+    if SUPPRESSION_INDEX.ready:
+        SUPPRESSION_INDEX.maybe_refresh()
+        if not SUPPRESSION_INDEX.might_be_suppressed(lead_id, lead_domain):
+            return False
+    return lookup_lead_skipped(lead_id, lead_domain)
+
+def lookup_lead_skipped(lead_id: str, lead_domain: str | None = None) -> bool:
     try:
         resp = leads_table.get_item(
             Key={"lead_id": lead_id},
@@ -441,26 +833,231 @@ def parse_iso(dt_str: str) -> datetime | None:
     except Exception:
         return None
 
-def should_skip_cached(url: str) -> bool:
-    if not VISITED_CACHE_ENABLED:
-        return False
-    try:
-        resp = visited_table.get_item(
-            Key={"page_url": url},
-            ProjectionExpression="page_url,last_crawled",
-        )
-        item = resp.get("Item")
+class FingerprintSet:
+    """
+    Set of strings kept as 64-bit blake2b fingerprints in an open-addressing
+    array("Q") table (linear probing, at most half full): 16-32 bytes per
+    entry instead of the ~150 a set[str] of URLs costs. Two different
+    strings share a fingerprint with probability ~n^2 / 2^65 (about 3e-8 at
+    1M entries), in which case the second is reported as already present.
+    Writers need external locking (STATE_LOCK / the frontier lock), the same
+    as the plain sets it replaces; lock-free membership checks stay safe.
+    """
+
+    MIN_SLOTS = 1024
+
+    def __init__(self, values=()):
+        self.table = (array("Q", bytes(8 * self.MIN_SLOTS)), self.MIN_SLOTS - 1)
+        self.count = 0
+        self.update(values)
+
+    @staticmethod
+    def fingerprint(value: str) -> int:
+        fp = int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
+        return fp or 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, value: str) -> bool:
+        return self.has_fingerprint(self.fingerprint(value))
+
+    def __iter__(self):
+        return (fp for fp in self.table[0] if fp)
+
+    def has_fingerprint(self, fp: int) -> bool:
+        slots, mask = self.table
+        i = fp & mask
+        while True:
+            cur = slots[i]
+            if cur == fp:
+                return True
+            if not cur:
+                return False
+            i = (i + 1) & mask
+
+    def add(self, value: str):
+        self.add_fingerprint(self.fingerprint(value))
+
+    def add_fingerprint(self, fp: int):
+        slots, mask = self.table
+        i = fp & mask
+        while True:
+            cur = slots[i]
+            if cur == fp:
+                return
+            if not cur:
+                break
+            i = (i + 1) & mask
+        slots[i] = fp
+        self.count += 1
+        if self.count * 2 > mask + 1:
+            self._grow()
+
+    def update(self, values):
+        for value in values:
+            self.add(value)
+
+    def _grow(self):
+        slots, mask = self.table
+        size = (mask + 1) * 2
+        new_slots = array("Q", bytes(8 * size))
+        new_mask = size - 1
+        for fp in slots:
+            if not fp:
+                continue
+            i = fp & new_mask
+            while new_slots[i]:
+                i = (i + 1) & new_mask
+            new_slots[i] = fp
+        self.table = (new_slots, new_mask)
+
+    def to_base64(self, exclude: set[int] = frozenset()) -> str:
+        return base64.b64encode(array("Q", (fp for fp in self if fp not in exclude)).tobytes()).decode("ascii")
+
+    def update_from_base64(self, data: str):
+        fps = array("Q")
+        fps.frombytes(base64.b64decode(data))
+        for fp in fps:
+            self.add_fingerprint(fp)
+
+def new_url_set() -> set[str] | FingerprintSet:
+    """
+    Container for visited urls, seen lead ids and frontier de-dupe.
+    """
+    return FingerprintSet() if VISITED_FINGERPRINTS else set()
+
+def dump_url_set(values: set[str] | FingerprintSet, exclude: set[str] = frozenset()) -> list | dict:
+    if isinstance(values, FingerprintSet):
+        return {"fingerprints": values.to_base64({FingerprintSet.fingerprint(u) for u in exclude})}
+    return [u for u in values if u not in exclude]
+
+def load_url_set(target: set[str] | FingerprintSet, data: list | dict):
+    if not isinstance(data, dict):
+        target.update(data)
+    elif isinstance(target, FingerprintSet):
+        target.update_from_base64(data.get("fingerprints", ""))
+    else:
+        print("Checkpoint holds url fingerprints; set VISITED_FINGERPRINTS=1 to restore them.")
+
+PAGE_VALIDATOR_FIELDS = ("etag", "last_modified", "content_hash")
+VISITED_PROJECTION = "page_url,last_crawled," + ",".join(PAGE_VALIDATOR_FIELDS)
+
+class VisitedCache:
+    """
+    Answers "was this URL crawled recently?" from VISITED_CACHE_TABLE with
+    an in-process LRU in front of it. Hits are kept until the page falls
+    out of VISITED_CACHE_TTL_HOURS (forever when the TTL is 0); misses are
+    kept for VISITED_LRU_MISS_SECONDS so pages crawled by other workers
+    are noticed. prime() resolves many URLs with batch_get_item. For pages
+    that are due for a re-crawl the stored ETag / Last-Modified / content
+    hash are kept so fetch can make a conditional request.
+    """
+
+    BATCH_SIZE = 100
+
+    def __init__(self, max_entries: int = VISITED_LRU_SIZE):
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[str, tuple[bool, float, dict | None]] = OrderedDict()
+        self.max_entries = max_entries
+
+    def _remember(self, url: str, skip: bool, expires_at: float, validators: dict | None = None):
+        with self.lock:
+            self.entries[url] = (skip, expires_at, validators)
+            self.entries.move_to_end(url)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def _entry(self, url: str) -> tuple[bool, float, dict | None] | None:
+        with self.lock:
+            entry = self.entries.get(url)
+            if not entry:
+                return None
+            if entry[1] <= time.time():
+                del self.entries[url]
+                return None
+            self.entries.move_to_end(url)
+            return entry
+
+    def _cached(self, url: str) -> bool | None:
+        entry = self._entry(url)
+        return entry[0] if entry else None
+
+    def validators(self, url: str) -> dict | None:
+        entry = self._entry(url)
+        return entry[2] if entry else None
+
+    def _remember_item(self, url: str, item: dict | None):
+        now = time.time()
         if not item:
-            return False
+            self._remember(url, False, now + VISITED_LRU_MISS_SECONDS)
+            return
         if VISITED_CACHE_TTL_HOURS <= 0:
-            return True
+            self._remember(url, True, float("inf"))
+            return
         last = parse_iso(item.get("last_crawled", ""))
         if not last:
+            self._remember(url, False, now + VISITED_LRU_MISS_SECONDS)
+            return
+        fresh_until = last.timestamp() + VISITED_CACHE_TTL_HOURS * 3600.0
+        if fresh_until > now:
+            self._remember(url, True, fresh_until)
+        else:
+            validators = {k: item[k] for k in PAGE_VALIDATOR_FIELDS if item.get(k)}
+            self._remember(url, False, now + VISITED_LRU_MISS_SECONDS, validators or None)
+
+    def record(self, item: dict):
+        self._remember_item(item["page_url"], item)
+
+    def should_skip(self, url: str) -> bool:
+        if not VISITED_CACHE_ENABLED:
             return False
-        age = (utc_now() - last).total_seconds() / 3600.0
-        return age < VISITED_CACHE_TTL_HOURS
-    except Exception:
-        return False
+        cached = self._cached(url)
+        if cached is not None:
+            return cached
+        try:
+            resp = visited_table.get_item(
+                Key={"page_url": url},
+                ProjectionExpression=VISITED_PROJECTION,
+            )
+        except Exception:
+            return False
+        self._remember_item(url, resp.get("Item"))
+        return bool(self._cached(url))
+
+    def prime(self, urls: list[str]):
+        if not VISITED_CACHE_ENABLED:
+            return
+        pending = [u for u in dict.fromkeys(urls) if u and self._cached(u) is None]
+        for i in range(0, len(pending), self.BATCH_SIZE):
+            chunk = pending[i:i + self.BATCH_SIZE]
+            found = {}
+            request = {
+                VISITED_CACHE_TABLE: {
+                    "Keys": [{"page_url": u} for u in chunk],
+                    "ProjectionExpression": VISITED_PROJECTION,
+                }
+            }
+            try:
+                for _ in range(5):
+                    resp = dynamodb.batch_get_item(RequestItems=request)
+                    for item in resp.get("Responses", {}).get(VISITED_CACHE_TABLE, []):
+                        found[item["page_url"]] = item
+                    request = resp.get("UnprocessedKeys") or {}
+                    if not request:
+                        break
+            except Exception as e:
+                print(f"DynamoDB visited batch lookup failed: {e}")
+                continue
+            unresolved = {k["page_url"] for k in request.get(VISITED_CACHE_TABLE, {}).get("Keys", [])}
+            for u in chunk:
+                if u not in unresolved:
+                    self._remember_item(u, found.get(u))
+
+VISITED_CACHE = VisitedCache()
+
+def should_skip_cached(url: str) -> bool:
+    return VISITED_CACHE.should_skip(url)
 
 def is_http_url(u: str) -> bool:
     try:
@@ -516,34 +1113,327 @@ def detect_role(title: str, headings: str, body: str, url: str) -> tuple[str | N
         return None, 0
     return best, best_score
 
+THROTTLE_STATUS_CODES = (429, 503)
+
+def parse_retry_after(value: str | None) -> float:
+    if not value:
+        return 0.0
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except Exception:
+        return 0.0
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - utc_now()).total_seconds())
+
+class DomainRateController:
+    """
+    AIMD delay per netloc, starting at SLEEP_BETWEEN_REQUESTS. Each fast,
+    healthy response shortens the delay by RATE_DECREASE_STEP down to
+    RATE_MIN_DELAY; a 429/503, a timeout or a response slower than
+    RATE_SLOW_SECONDS multiplies it by RATE_BACKOFF_FACTOR up to
+    RATE_MAX_DELAY. Retry-After additionally blocks the domain until the
+    time the server asked for. With RATE_ADAPTIVE=0 every domain keeps
+    SLEEP_BETWEEN_REQUESTS.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.delays: dict[str, float] = {}
+        self.blocked_until: dict[str, float] = {}
+        self.throttles: dict[str, int] = {}
+
+    def delay(self, netloc: str) -> float:
+        with self.lock:
+            return self.delays.get(netloc, SLEEP_BETWEEN_REQUESTS)
+
+    def next_slot(self, netloc: str, last_request: float) -> float:
+        with self.lock:
+            delay = self.delays.get(netloc, SLEEP_BETWEEN_REQUESTS)
+            return max(last_request + delay, self.blocked_until.get(netloc, 0.0))
+
+    def _back_off(self, netloc: str):
+        current = self.delays.get(netloc, SLEEP_BETWEEN_REQUESTS)
+        self.delays[netloc] = min(RATE_MAX_DELAY, max(current, RATE_MIN_DELAY) * RATE_BACKOFF_FACTOR)
+        self.throttles[netloc] = self.throttles.get(netloc, 0) + 1
+
+    def observe(self, netloc: str, status_code: int | None, latency: float, retry_after: str | None = None):
+        """
+        status_code None means the request failed without a response.
+        """
+        if not RATE_ADAPTIVE or not netloc:
+            return
+        with self.lock:
+            if status_code is None or status_code in THROTTLE_STATUS_CODES or latency > RATE_SLOW_SECONDS:
+                self._back_off(netloc)
+                wait = parse_retry_after(retry_after)
+                if wait > 0:
+                    self.blocked_until[netloc] = time.time() + min(wait, RATE_MAX_DELAY * 10)
+                return
+            if status_code < 500:
+                current = self.delays.get(netloc, SLEEP_BETWEEN_REQUESTS)
+                self.delays[netloc] = max(RATE_MIN_DELAY, current - RATE_DECREASE_STEP)
+
+    def summary(self, top: int = 5) -> str:
+        with self.lock:
+            events = sum(self.throttles.values())
+            slowest = sorted(self.delays.items(), key=lambda kv: kv[1], reverse=True)[:top]
+        listed = ", ".join(f"{netloc} {delay:.1f}s" for netloc, delay in slowest)
+        return f"Rate control: {events} throttle events on {len(self.throttles)} domains; slowest: {listed or 'n/a'}."
+
+RATE_CONTROL = DomainRateController()
+
+def domain_ready_at(netloc: str) -> float:
+    """
+    Earliest time the next request to netloc may start. Caller holds STATE_LOCK.
+    """
+    return RATE_CONTROL.next_slot(netloc, DOMAIN_LAST_REQUEST.get(netloc, 0.0))
+
+def wait_for_domain_slot(netloc: str):
+    """
+    Reserves the next polite request slot for netloc and sleeps until it.
+    The slot is claimed under STATE_LOCK so concurrent threads hitting the
+    same domain queue up behind each other instead of firing together.
+    """
+    with STATE_LOCK:
+        now = time.time()
+        slot = max(now, domain_ready_at(netloc))
+        DOMAIN_LAST_REQUEST[netloc] = slot
+    delay = slot - time.time()
+    if delay > 0:
+        time.sleep(delay)
+
+NEGATIVE_STATUS_CODES = (404, 410)
+
+class NegativeCache:
+    """
+    URLs that answered 404/410, kept for NEGATIVE_CACHE_TTL_HOURS and
+    persisted to NEGATIVE_CACHE_FILE so guessed contact paths that do not
+    exist are not re-requested on every run.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries: dict[str, float] = {}
+
+    def add(self, url: str):
+        if NEGATIVE_CACHE_TTL_HOURS <= 0:
+            return
+        with self.lock:
+            self.entries[url] = time.time() + NEGATIVE_CACHE_TTL_HOURS * 3600.0
+
+    def __contains__(self, url: str) -> bool:
+        with self.lock:
+            expires_at = self.entries.get(url)
+            if expires_at is None:
+                return False
+            if expires_at <= time.time():
+                del self.entries[url]
+                return False
+            return True
+
+    def load(self, path: str):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f) or {}
+        except Exception:
+            return
+        now = time.time()
+        with self.lock:
+            self.entries.update({u: x for u, x in data.items() if x > now})
+
+    def save(self, path: str):
+        now = time.time()
+        with self.lock:
+            data = {u: x for u, x in self.entries.items() if x > now}
+        try:
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+        except Exception as e:
+            print(f"Negative cache save failed: {e}")
+
+class CircuitBreaker:
+    """
+    Counts consecutive timeouts / connection errors per netloc. After
+    CIRCUIT_BREAKER_FAILURES in a row the domain is dropped for the rest
+    of the run: fetch refuses it and the frontier discards its queue.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.failures: dict[str, int] = {}
+        self.open: set[str] = set()
+
+    def record_success(self, netloc: str):
+        with self.lock:
+            self.failures.pop(netloc, None)
+
+    def record_failure(self, netloc: str):
+        if CIRCUIT_BREAKER_FAILURES <= 0 or not netloc:
+            return
+        with self.lock:
+            count = self.failures.get(netloc, 0) + 1
+            self.failures[netloc] = count
+            if count >= CIRCUIT_BREAKER_FAILURES and netloc not in self.open:
+                self.open.add(netloc)
+                print(f"Circuit open for {netloc} after {count} consecutive failures")
+
+    def is_open(self, netloc: str) -> bool:
+        return netloc in self.open
+
+NEGATIVE_CACHE = NegativeCache()
+CIRCUIT_BREAKER = CircuitBreaker()
+# Time spent on requests that ended in 404/410 or a network failure, and
+# how many such requests were skipped, for the end-of-run savings estimate.
+FETCH_SAVINGS = {
+    "negative_seconds": 0.0,
+    "negative_fetches": 0,
+    "negative_skipped": 0,
+    "failure_seconds": 0.0,
+    "failure_fetches": 0,
+    "breaker_skipped": 0,
+    "not_modified": 0,
+    "unchanged": 0,
+    "non_html": 0,
+    "truncated": 0,
+}
+
+def count_saving(key: str, amount: float = 1):
+    with STATE_LOCK:
+        FETCH_SAVINGS[key] += amount
+
+def savings_summary() -> str:
+    st = FETCH_SAVINGS
+    avg_negative = st["negative_seconds"] / st["negative_fetches"] if st["negative_fetches"] else 1.0
+    avg_failure = st["failure_seconds"] / st["failure_fetches"] if st["failure_fetches"] else float(REQUEST_TIMEOUT)
+    saved = (
+        st["negative_skipped"] * (avg_negative + SLEEP_BETWEEN_REQUESTS)
+        + st["breaker_skipped"] * (avg_failure + SLEEP_BETWEEN_REQUESTS)
+    )
+    return (
+        f"Skipped {st['negative_skipped']} known 404/410 urls and {st['breaker_skipped']} urls on "
+        f"{len(CIRCUIT_BREAKER.open)} dead domains (~{saved:.0f}s saved). "
+        f"Re-crawls: {st['not_modified']} not modified, {st['unchanged']} unchanged by hash. "
+        f"Downloads: {st['non_html']} non-HTML skipped, {st['truncated']} cut at MAX_PAGE_BYTES."
+    )
+
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+
+def is_html_content_type(content_type: str | None) -> bool:
+    if not content_type:
+        return True
+    return content_type.split(";", 1)[0].strip().lower() in HTML_CONTENT_TYPES
+
+def read_capped(r, max_bytes: int) -> tuple[bytes, bool]:
+    """
+    Reads a streamed response body up to max_bytes (0 = no cap).
+    Returns: (body, truncated)
+    """
+    chunks = []
+    size = 0
+    for chunk in r.iter_content(chunk_size=16384):
+        if not chunk:
+            continue
+        if max_bytes > 0 and size + len(chunk) > max_bytes:
+            chunks.append(chunk[:max_bytes - size])
+            return b"".join(chunks), True
+        chunks.append(chunk)
+        size += len(chunk)
+    return b"".join(chunks), False
+
 def fetch(url: str) -> str | None:
     url = normalize_url(url)
+    netloc = normalize_netloc(urlparse(url).netloc)
+    if url in NEGATIVE_CACHE:
+        count_saving("negative_skipped")
+        return None
+    if CIRCUIT_BREAKER.is_open(netloc):
+        count_saving("breaker_skipped")
+        return None
+    started = None
     try:
         if should_skip_cached(url):
             return None
-        netloc = normalize_netloc(urlparse(url).netloc)
         if MAX_PAGES_PER_DOMAIN > 0 and netloc:
-            count = DOMAIN_PAGES.get(netloc, 0)
-            if count >= MAX_PAGES_PER_DOMAIN:
+            with STATE_LOCK:
+                count = DOMAIN_PAGES.get(netloc, 0)
+                if count >= MAX_PAGES_PER_DOMAIN:
+                    return None
+                DOMAIN_PAGES[netloc] = count + 1
+
+        wait_for_domain_slot(netloc)
+
+        validators = VISITED_CACHE.validators(url) or {}
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        started = time.time()
+        with session.get(
+            url,
+            timeout=REQUEST_TIMEOUT,
+            allow_redirects=True,
+            headers=headers or None,
+            stream=True,
+        ) as r:
+            CIRCUIT_BREAKER.record_success(netloc)
+            RATE_CONTROL.observe(netloc, r.status_code, time.time() - started, r.headers.get("Retry-After"))
+            record = {
+                "page_url": url,
+                "last_crawled": now_iso(),
+                "status_code": int(r.status_code),
+            }
+            if r.status_code == 304:
+                # Keep the validators we re-crawled with; put_item replaces the record.
+                record.update(validators)
+                safe_put_pages(record)
+                count_saving("not_modified")
                 return None
-            DOMAIN_PAGES[netloc] = count + 1
-
-        last = DOMAIN_LAST_REQUEST.get(netloc, 0.0)
-        elapsed = time.time() - last
-        if elapsed < SLEEP_BETWEEN_REQUESTS:
-            time.sleep(SLEEP_BETWEEN_REQUESTS - elapsed)
-        DOMAIN_LAST_REQUEST[netloc] = time.time()
-
-        r = session.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
-        safe_put_pages({
-            "page_url": url,
-            "last_crawled": now_iso(),
-            "status_code": int(r.status_code),
-        })
-        if r.status_code != 200:
+            if r.status_code != 200:
+                safe_put_pages(record)
+                if r.status_code in NEGATIVE_STATUS_CODES:
+                    NEGATIVE_CACHE.add(url)
+                    count_saving("negative_seconds", time.time() - started)
+                    count_saving("negative_fetches")
+                return None
+            content_type = r.headers.get("Content-Type")
+            if not is_html_content_type(content_type):
+                record["error"] = f"skipped content type {content_type}"[:300]
+                safe_put_pages(record)
+                count_saving("non_html")
+                return None
+            body, truncated = read_capped(r, MAX_PAGE_BYTES)
+            if truncated:
+                count_saving("truncated")
+            html = body.decode(r.encoding or "utf-8", errors="replace")
+            etag = r.headers.get("ETag")
+            last_modified = r.headers.get("Last-Modified")
+
+        content_hash = sha_id(html)
+        record["content_hash"] = content_hash
+        if etag:
+            record["etag"] = etag
+        if last_modified:
+            record["last_modified"] = last_modified
+        safe_put_pages(record)
+        if validators.get("content_hash") == content_hash:
+            count_saving("unchanged")
             return None
-        return r.text
+        return html
     except Exception as e:
+        if isinstance(e, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+            CIRCUIT_BREAKER.record_failure(netloc)
+            RATE_CONTROL.observe(netloc, None, time.time() - (started or time.time()))
+            if started is not None:
+                count_saving("failure_seconds", time.time() - started)
+                count_saving("failure_fetches")
         safe_put_pages({
             "page_url": url,
             "last_crawled": now_iso(),
@@ -553,10 +1443,80 @@ def fetch(url: str) -> str | None:
         print(f"Fetch failed: {url} -> {e}")
         return None
 
-def extract_links(base_url: str, soup: BeautifulSoup, seed_netloc: str) -> list[str]:
+def parse_with_soup(html: str, features: str) -> tuple[str, list[str], str, list[str]]:
+    soup = BeautifulSoup(html, features)
+    title = (soup.title.get_text(" ", strip=True) if soup.title else "")
+    headings = [h.get_text(" ", strip=True) for h in soup.select("h1, h2, h3")]
+    text = soup.get_text(" ", strip=True)
+    hrefs = [a.get("href") or "" for a in soup.select("a[href]")]
+    return title, headings, text, hrefs
+
+def parse_with_selectolax(html: str) -> tuple[str, list[str], str, list[str]]:
+    tree = SelectolaxParser(html)
+    # BeautifulSoup's get_text skips script/style contents; match it.
+    for node in tree.css("script, style, template"):
+        node.decompose()
+
+    def node_text(node) -> str:
+        parts = node.text(separator="\x00", strip=True).split("\x00")
+        return " ".join(p for p in parts if p)
+
+    title_node = tree.css_first("title")
+    title = node_text(title_node) if title_node else ""
+    headings = [node_text(h) for h in tree.css("h1, h2, h3")]
+    text = node_text(tree.root) if tree.root else ""
+    hrefs = [a.attributes.get("href") or "" for a in tree.css("a[href]")]
+    return title, headings, text, hrefs
+
+PARSER_BACKENDS = {
+    "html.parser": lambda html: parse_with_soup(html, "html.parser"),
+    "lxml": lambda html: parse_with_soup(html, "lxml"),
+    "selectolax": parse_with_selectolax,
+}
+
+def parser_available(name: str) -> bool:
+    if name == "lxml":
+        return LXML_AVAILABLE
+    if name == "selectolax":
+        return SelectolaxParser is not None
+    return name in PARSER_BACKENDS
+
+def resolve_html_parser(name: str) -> str:
+    if name in PARSER_BACKENDS and parser_available(name):
+        return name
+    print(f"HTML parser {name!r} unavailable, falling back to html.parser")
+    return "html.parser"
+
+class PageModel:
+    """
+    One parsed page. The HTML is parsed a single time, with the backend
+    selected by HTML_PARSER, and everything the scorers, contact detection
+    and link extraction need is kept here, so nothing downstream re-parses
+    or re-serializes the document.
+    """
+
+    def __init__(self, url: str, html: str, parser: str | None = None):
+        parse = PARSER_BACKENDS[parser or ACTIVE_HTML_PARSER]
+        title, headings, text, hrefs = parse(html)
+        self.url = url
+        self.title = title
+        self.headings = " ".join(headings)[:1000]
+        self.text = text
+        self.hrefs = hrefs
+        self.mailtos = find_mailtos(self.hrefs)
+        self.emails = extract_page_emails(html, self.text, self.mailtos)
+
+    @property
+    def body(self) -> str:
+        return self.text[:5000]
+
+ACTIVE_HTML_PARSER = resolve_html_parser(HTML_PARSER)
+
+def extract_links(page: PageModel, seed_netloc: str) -> list[str]:
+    base_url = page.url
     links = []
-    for a in soup.select("a[href]"):
-        href = (a.get("href") or "").strip()
+    for href in page.hrefs:
+        href = href.strip()
         if not href:
             continue
         if href.startswith(("mailto:", "tel:", "javascript:")):
@@ -591,13 +1551,15 @@ def crawl_one(
     visited: set[str],
     leads_seen: set[str],
     enqueue_fn,
+    prime_visited_cache: bool = False,
 ) -> tuple[int, int]:
     url = normalize_url(url)
     if not url:
         return 0, 0
-    if url in visited:
-        return 0, 0
-    visited.add(url)
+    with STATE_LOCK:
+        if url in visited:
+            return 0, 0
+        visited.add(url)
 
     seed_netloc = normalize_netloc(urlparse(seed_url).netloc)
 
@@ -605,17 +1567,12 @@ def crawl_one(
     if not html:
         return 0, 0
 
-    soup = BeautifulSoup(html, "html.parser")
-    title = (soup.title.get_text(" ", strip=True) if soup.title else "")
-    headings = " ".join(
-        h.get_text(" ", strip=True) for h in soup.select("h1, h2, h3")
-    )[:1000]
-    page_text = soup.get_text(" ", strip=True)[:5000]
-    role, role_conf = detect_role(title, headings, page_text, url)
-    lib_conf = library_confidence(title, headings, page_text, url)
+    page = PageModel(url, html)
+    role, role_conf = detect_role(page.title, page.headings, page.body, url)
+    lib_conf = library_confidence(page.title, page.headings, page.body, url)
 
-    contact_type, email, contact_url = detect_contact(url, html)
-    company_name = derive_company_name(title, url)
+    contact_type, email, contact_url = detect_contact(page)
+    company_name = derive_company_name(page.title, url)
 
     leads_saved = 0
     if contact_type in ("email", "form"):
@@ -650,6 +1607,12 @@ def crawl_one(
                 allowed = False
             if LIBRARIES_ONLY and lib_conf < MIN_LIBRARY_CONFIDENCE:
                 allowed = False
+            if allowed:
+                with STATE_LOCK:
+                    if lead_id in leads_seen:
+                        allowed = False
+                    else:
+                        leads_seen.add(lead_id)
             if allowed:
                 item = {
                     "lead_id": lead_id,
@@ -667,41 +1630,44 @@ def crawl_one(
                 }
                 safe_upsert_lead(item)
                 append_lead_export(item)
-                leads_seen.add(lead_id)
                 leads_saved = 1
                 if email:
                     print(f"Lead saved: {role} email {email}")
                 else:
                     print(f"Lead saved: {role} form {contact_url}")
 
-    links = extract_links(url, soup, seed_netloc)
+    links = [nxt for nxt in extract_links(page, seed_netloc) if nxt not in visited]
+    if prime_visited_cache:
+        VISITED_CACHE.prime(links)
     for nxt in links:
-        if nxt not in visited:
-            enqueue_fn(nxt, seed_url)
+        enqueue_fn(nxt, seed_url)
 
     return leads_saved, 1
 
-def find_mailtos(soup: BeautifulSoup) -> list[str]:
+def find_mailtos(hrefs: list[str]) -> list[str]:
     emails = set()
-    for a in soup.select("a[href^='mailto:']"):
-        href = a.get("href", "")
+    for href in hrefs:
+        if not href.startswith("mailto:"):
+            continue
         addr = href.replace("mailto:", "").split("?")[0].strip().lower()
         if addr and is_candidate_email(addr):
             emails.add(addr)
     return sorted(emails)
 
-def extract_emails_from_soup(soup: BeautifulSoup) -> list[str]:
-    emails = set()
-
-    for e in find_mailtos(soup):
-        emails.add(e)
+def extract_page_emails(html: str, text: str, mailtos: list[str]) -> list[str]:
+    """
+    Email candidates for a page: mailto links, addresses in the raw HTML
+    (entities decoded, matching what the parse tree would serialize) and
+    obfuscated "name (at) host (dot) com" forms in the visible text.
+    """
+    emails = set(mailtos)
 
-    for e in EMAIL_RE.findall(str(soup)):
+    markup = html_lib.unescape(html) if "&" in html else html
+    for e in EMAIL_RE.findall(markup):
         e = (e or "").strip().lower()
         if is_candidate_email(e):
             emails.add(e)
 
-    text = soup.get_text(" ", strip=True)
     for pat in OBFUSCATED_EMAIL_PATTERNS:
         for m in pat.findall(text):
             if len(m) == 3:
@@ -711,51 +1677,150 @@ def extract_emails_from_soup(soup: BeautifulSoup) -> list[str]:
 
     return sorted(emails)
 
-def pick_contact_link(base_url: str, soup: BeautifulSoup) -> str | None:
-    for a in soup.select("a[href]"):
-        href = (a.get("href") or "").strip()
+def pick_contact_link(page: PageModel) -> str | None:
+    for href in page.hrefs:
+        href = href.strip()
         if not href:
             continue
-        url = urljoin(base_url, href)
+        url = urljoin(page.url, href)
         path = urlparse(url).path.lower()
         if any(h in path for h in CONTACT_HINTS):
             return normalize_url(url)
     return None
 
-def detect_contact(page_url: str, html: str) -> tuple[str | None, str | None, str | None]:
+CONTACT_RANK = {"email": 2, "form": 1, None: 0}
+
+class ContactCache:
+    """
+    Per-domain contact resolution: netloc -> (contact_type, email,
+    contact_url), where contact_type None means probing found nothing.
+    Entries live for CONTACT_CACHE_TTL_HOURS and are optionally persisted
+    to CONTACT_CACHE_FILE, so a domain's contact pages are fetched at most
+    once per run (or per TTL when persisted).
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries: dict[str, tuple[str | None, str | None, str | None, float]] = {}
+        self.stats = {"hits": 0, "resolved": 0}
+
+    def get(self, netloc: str) -> tuple[str | None, str | None, str | None] | None:
+        with self.lock:
+            entry = self.entries.get(netloc)
+            if not entry:
+                return None
+            if entry[3] <= time.time():
+                del self.entries[netloc]
+                return None
+            self.stats["hits"] += 1
+            return entry[:3]
+
+    def put(self, netloc: str, result: tuple[str | None, str | None, str | None]):
+        """
+        Keeps the better of the existing and new result (email > form > none).
+        """
+        ttl = CONTACT_CACHE_TTL_HOURS * 3600.0 if CONTACT_CACHE_TTL_HOURS > 0 else float("inf")
+        with self.lock:
+            current = self.entries.get(netloc)
+            if current and CONTACT_RANK[current[0]] > CONTACT_RANK[result[0]]:
+                return
+            self.entries[netloc] = (*result, time.time() + ttl)
+            self.stats["resolved"] += 1
+
+    def load(self, path: str):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f) or {}
+        except Exception:
+            return
+        now = time.time()
+        with self.lock:
+            for netloc, (contact_type, email, contact_url, expires_at) in data.items():
+                if expires_at is None or expires_at > now:
+                    self.entries[netloc] = (contact_type, email, contact_url, expires_at or float("inf"))
+
+    def save(self, path: str):
+        with self.lock:
+            data = {
+                netloc: [t, e, u, None if x == float("inf") else x]
+                for netloc, (t, e, u, x) in self.entries.items()
+            }
+        try:
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+        except Exception as e:
+            print(f"Contact cache save failed: {e}")
+
+CONTACT_CACHE = ContactCache()
+
+def resolve_contact_page(contact_url: str) -> tuple[str | None, str | None, str | None] | None:
+    """
+    Fetches a contact candidate. Returns None if it could not be fetched,
+    otherwise ("email", email, url) or ("form", None, url).
+    """
+    html = fetch(contact_url)
+    if not html:
+        return None
+    emails = PageModel(contact_url, html).emails
+    if emails:
+        return "email", emails[0], contact_url
+    return "form", None, contact_url
+
+def probe_contact_paths(base: str) -> tuple[str | None, str | None, str | None]:
+    """
+    Tries COMMON_CONTACT_PATHS in order and returns the first one that can
+    be fetched. With CONTACT_PROBE_CONCURRENCY > 1 several candidates are in
+    flight at once (each still waits for its per-domain politeness slot)
+    and the rest are cancelled as soon as the earliest hit is known.
+    """
+    guesses = [normalize_url(base + path) for path in COMMON_CONTACT_PATHS]
+    if CONTACT_PROBE_CONCURRENCY <= 1:
+        for guess in guesses:
+            result = resolve_contact_page(guess)
+            if result:
+                return result
+        return None, None, None
+
+    with ThreadPoolExecutor(max_workers=CONTACT_PROBE_CONCURRENCY) as pool:
+        futures = [pool.submit(resolve_contact_page, guess) for guess in guesses]
+        try:
+            for fut in futures:
+                result = fut.result()
+                if result:
+                    return result
+        finally:
+            for fut in futures:
+                fut.cancel()
+    return None, None, None
+
+def detect_contact(page: PageModel) -> tuple[str | None, str | None, str | None]:
     """
     Returns: (contact_type, email, contact_url)
     contact_type: "email" | "form" | None
     """
-    soup = BeautifulSoup(html, "html.parser")
+    page_url = page.url
+    if page.emails:
+        return "email", page.emails[0], page_url
 
-    emails = extract_emails_from_soup(soup)
-    if emails:
-        return "email", emails[0], page_url
+    parsed = urlparse(page_url)
+    netloc = normalize_netloc(parsed.netloc)
+    cached = CONTACT_CACHE.get(netloc)
 
-    contact_url = pick_contact_link(page_url, soup)
+    contact_url = pick_contact_link(page)
     if contact_url:
-        html2 = fetch(contact_url)
-        if html2:
-            soup2 = BeautifulSoup(html2, "html.parser")
-            emails2 = extract_emails_from_soup(soup2)
-            if emails2:
-                return "email", emails2[0], contact_url
-        return "form", None, contact_url
-
-    base = f"{urlparse(page_url).scheme}://{urlparse(page_url).netloc}"
-    for path in COMMON_CONTACT_PATHS:
-        guess = normalize_url(base + path)
-        html3 = fetch(guess)
-        if not html3:
-            continue
-        soup3 = BeautifulSoup(html3, "html.parser")
-        emails3 = extract_emails_from_soup(soup3)
-        if emails3:
-            return "email", emails3[0], guess
-        return "form", None, guess
-
-    return None, None, None
+        if cached and (cached[0] == "email" or cached[2] == contact_url):
+            return cached
+        result = resolve_contact_page(contact_url) or ("form", None, contact_url)
+        CONTACT_CACHE.put(netloc, result)
+        return result
+
+    if cached:
+        return cached
+    result = probe_contact_paths(f"{parsed.scheme}://{parsed.netloc}")
+    CONTACT_CACHE.put(netloc, result)
+    return result
 
 def build_draft(role: str | None) -> str:
     if role in ("music_supervisor", "publisher"):
@@ -987,7 +2052,7 @@ def openai_search_urls(query: str, count: int) -> list[str]:
         "Content-Type": "application/json",
     }
     try:
-        r = requests.post(
+        r = session.post(
             f"{OPENAI_BASE_URL.rstrip('/')}/responses",
             headers=headers,
             json=payload,
@@ -1011,7 +2076,7 @@ def brave_search_urls(query: str, count: int) -> list[str]:
         "X-Subscription-Token": BRAVE_API_KEY,
         "User-Agent": USER_AGENT,
     }
-    r = requests.get(endpoint, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+    r = session.get(endpoint, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
     if r.status_code != 200:
         return []
     data = r.json()
@@ -1032,7 +2097,7 @@ def serper_search_urls(query: str, count: int) -> list[str]:
         "Content-Type": "application/json",
     }
     payload = {"q": query, "num": min(count, 20)}
-    r = requests.post(endpoint, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
+    r = session.post(endpoint, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
     if r.status_code != 200:
         return []
     data = r.json()
@@ -1118,20 +2183,731 @@ def discover_seed_urls() -> list[str]:
     print(f"Discovery added {len(found)} seed urls")
     return found
 
-def main():
-    seeds = load_seeds("seeds.txt")
-    discovered = discover_seed_urls()
-    if discovered:
-        seed_set = {normalize_url(s) for s in seeds if s}
-        for u in discovered:
-            nu = normalize_url(u)
-            if not nu:
+class CrawlFrontier:
+    """
+    Local-mode frontier.
+
+    Each normalized netloc has its own heap of URLs ordered by score_link
+    (higher first), then link depth, then discovery order. Domains wait in
+    a min-heap of next allowed fetch time; once their politeness delay has
+    passed they move to a ready heap ordered by their best queued score and
+    by how many pages their seed has already been given, so the page budget
+    goes to the most promising URLs without starving other seeds. A popped
+    domain stays out of both heaps until release() is called for it.
+    URLs are de-duplicated when they are pushed.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.queues: dict[str, list] = {}
+        self.waiting: list[tuple[float, int, str]] = []
+        self.ready: list[tuple[int, int, int, str]] = []
+        self.ready_seq: dict[str, int] = {}
+        self.scheduled: set[str] = set()
+        self.busy: set[str] = set()
+        self.seen = new_url_set()
+        self.seed_served: dict[str, int] = {}
+        self.in_flight: dict[str, tuple[str, str, int]] = {}
+        self.seq = 0
+
+    def __len__(self) -> int:
+        with self.lock:
+            return sum(len(q) for q in self.queues.values())
+
+    def _next_seq(self) -> int:
+        self.seq += 1
+        return self.seq
+
+    def _schedule(self, netloc: str):
+        if netloc in self.scheduled or netloc in self.busy:
+            return
+        if not self.queues.get(netloc):
+            return
+        with STATE_LOCK:
+            ready_at = domain_ready_at(netloc)
+        heapq.heappush(self.waiting, (ready_at, self._next_seq(), netloc))
+        self.scheduled.add(netloc)
+
+    def _mark_ready(self, netloc: str):
+        q = self.queues.get(netloc)
+        if not q:
+            return
+        top_score, _, _, _, seed_url = q[0]
+        seq = self._next_seq()
+        self.ready_seq[netloc] = seq
+        heapq.heappush(self.ready, (top_score, self.seed_served.get(seed_url, 0), seq, netloc))
+
+    def push(self, url: str, seed_url: str, depth: int = 0) -> bool:
+        netloc = normalize_netloc(urlparse(url).netloc)
+        with self.lock:
+            if url in self.seen:
+                return False
+            self.seen.add(url)
+            entry = (-score_link(url), depth, self._next_seq(), url, seed_url)
+            q = self.queues.setdefault(netloc, [])
+            heapq.heappush(q, entry)
+            if netloc in self.ready_seq and q[0] is entry:
+                self._mark_ready(netloc)
+            self._schedule(netloc)
+            return True
+
+    def pop_ready(self, now: float | None = None) -> tuple[str, str, int] | None:
+        """
+        Returns: (url, seed_url, depth) from a domain that may be fetched
+        now, or None.
+        """
+        now = time.time() if now is None else now
+        with self.lock:
+            while self.waiting and self.waiting[0][0] <= now:
+                _, _, netloc = heapq.heappop(self.waiting)
+                self._mark_ready(netloc)
+            while self.ready:
+                _, _, seq, netloc = heapq.heappop(self.ready)
+                if self.ready_seq.get(netloc) != seq:
+                    continue
+                del self.ready_seq[netloc]
+                self.scheduled.discard(netloc)
+                q = self.queues.get(netloc)
+                if not q:
+                    continue
+                if domain_page_limit_reached(netloc) or CIRCUIT_BREAKER.is_open(netloc):
+                    dropped = self.queues.pop(netloc, None) or []
+                    if CIRCUIT_BREAKER.is_open(netloc):
+                        count_saving("breaker_skipped", len(dropped))
+                    continue
+                self.busy.add(netloc)
+                _, depth, _, url, seed_url = heapq.heappop(q)
+                self.seed_served[seed_url] = self.seed_served.get(seed_url, 0) + 1
+                self.in_flight[url] = (url, seed_url, depth)
+                return url, seed_url, depth
+        return None
+
+    def release(self, url: str):
+        netloc = normalize_netloc(urlparse(url).netloc)
+        with self.lock:
+            self.in_flight.pop(url, None)
+            self.busy.discard(netloc)
+            if not self.queues.get(netloc):
+                self.queues.pop(netloc, None)
+                return
+            self._schedule(netloc)
+
+    def next_wait(self, now: float | None = None) -> float | None:
+        """
+        Seconds until the earliest scheduled domain is ready, or None when
+        nothing is scheduled (frontier empty or every domain busy).
+        """
+        now = time.time() if now is None else now
+        with self.lock:
+            if self.ready_seq:
+                return 0.0
+            if not self.waiting:
+                return None
+            return max(0.0, self.waiting[0][0] - now)
+
+    def snapshot(self) -> dict:
+        """
+        JSON-ready copy of the frontier: URLs popped but not yet released
+        ("in_flight"), queued URLs per domain in pop order ("pending"), the
+        de-dupe set and the per-seed page counts.
+        """
+        with self.lock:
+            pending = []
+            for q in self.queues.values():
+                pending.extend([url, seed_url, depth] for _, depth, _, url, seed_url in sorted(q))
+            return {
+                "in_flight": [list(entry) for entry in self.in_flight.values()],
+                "pending": pending,
+                "seen": dump_url_set(self.seen),
+                "seed_served": dict(self.seed_served),
+            }
+
+    def restore(self, state: dict):
+        """
+        Loads a snapshot() into an empty frontier. In-flight URLs are queued
+        again since their pages were never finished.
+        """
+        for url, seed_url, depth in state.get("in_flight", []) + state.get("pending", []):
+            self.push(url, seed_url, depth)
+        with self.lock:
+            load_url_set(self.seen, state.get("seen", []))
+            self.seed_served.update(state.get("seed_served", {}))
+
+def domain_page_limit_reached(netloc: str) -> bool:
+    if MAX_PAGES_PER_DOMAIN <= 0 or not netloc:
+        return False
+    with STATE_LOCK:
+        return DOMAIN_PAGES.get(netloc, 0) >= MAX_PAGES_PER_DOMAIN
+
+class CrawlCheckpoint:
+    """
+    Local-mode crawl state on disk: the frontier, visited / leads_seen,
+    DOMAIN_PAGES, DOMAIN_LAST_REQUEST and the run totals. Written atomically
+    every `every_pages` pages and when a crawl loop is interrupted, and
+    removed once a run finishes, so `python run.py --resume` only ever picks
+    up a run that stopped early.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, every_pages: int = 0):
+        self.path = path
+        self.every_pages = every_pages
+        self.saved_at_pages = 0
+        self.saves = 0
+
+    def maybe_save(self, frontier: CrawlFrontier, visited: set[str], leads_seen: set[str], pages_visited: int, leads_saved: int):
+        if self.every_pages <= 0 or pages_visited - self.saved_at_pages < self.every_pages:
+            return
+        self.save(frontier, visited, leads_seen, pages_visited, leads_saved)
+
+    def save(self, frontier: CrawlFrontier, visited: set[str], leads_seen: set[str], pages_visited: int, leads_saved: int):
+        frontier_state = frontier.snapshot()
+        # crawl_one marks a url visited before fetching it; unfinished ones
+        # are re-queued from the frontier snapshot instead.
+        unfinished = {url for url, _, _ in frontier_state["in_flight"]}
+        with STATE_LOCK:
+            data = {
+                "version": self.VERSION,
+                "saved_at": time.time(),
+                "pages_visited": pages_visited,
+                "leads_saved": leads_saved,
+                "frontier": frontier_state,
+                "visited": dump_url_set(visited, unfinished),
+                "leads_seen": dump_url_set(leads_seen),
+                "domain_pages": dict(DOMAIN_PAGES),
+                "domain_last_request": dict(DOMAIN_LAST_REQUEST),
+            }
+        try:
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except Exception as e:
+            print(f"Checkpoint save failed: {e}")
+            return
+        self.saved_at_pages = pages_visited
+        self.saves += 1
+
+    def load(self) -> dict | None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Checkpoint load failed: {e}")
+            return None
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return None
+        return data
+
+    def restore(self, data: dict, frontier: CrawlFrontier, visited: set[str], leads_seen: set[str]) -> tuple[int, int]:
+        """
+        Applies a loaded checkpoint to an empty frontier and sets.
+        Returns: (pages_visited, leads_saved) of the interrupted run.
+        """
+        with STATE_LOCK:
+            load_url_set(visited, data.get("visited", []))
+            load_url_set(leads_seen, data.get("leads_seen", []))
+            DOMAIN_PAGES.update(data.get("domain_pages", {}))
+            DOMAIN_LAST_REQUEST.update(data.get("domain_last_request", {}))
+        frontier.restore(data.get("frontier", {}))
+        pages_visited = int(data.get("pages_visited", 0))
+        self.saved_at_pages = pages_visited
+        return pages_visited, int(data.get("leads_saved", 0))
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Checkpoint cleanup failed: {e}")
+
+def crawl_local_serial(
+    frontier: CrawlFrontier,
+    visited: set[str],
+    leads_seen: set[str],
+    max_pages: float,
+    checkpoint: CrawlCheckpoint | None = None,
+    pages_visited: int = 0,
+    leads_saved: int = 0,
+) -> tuple[int, int]:
+    """
+    pages_visited / leads_saved are the totals to continue from (non-zero
+    when resuming from a checkpoint).
+    Returns: (pages_visited, leads_saved)
+    """
+    try:
+        while pages_visited < max_pages:
+            if MAX_LEADS_PER_RUN > 0 and leads_saved >= MAX_LEADS_PER_RUN:
+                break
+            item = frontier.pop_ready()
+            if not item:
+                delay = frontier.next_wait()
+                if delay is None:
+                    break
+                time.sleep(delay)
                 continue
-            if nu not in seed_set:
-                seeds.append(nu)
-                seed_set.add(nu)
-    if not seeds:
-        return
+            url, seed_url, depth = item
+
+            def enqueue_local(nxt: str, seed: str, depth: int = depth + 1):
+                frontier.push(nxt, seed, depth)
+
+            saved, visited_count = crawl_one(url, seed_url, visited, leads_seen, enqueue_local)
+            frontier.release(url)
+            pages_visited += visited_count
+            leads_saved += saved
+            if checkpoint:
+                checkpoint.maybe_save(frontier, visited, leads_seen, pages_visited, leads_saved)
+    except BaseException:
+        if checkpoint:
+            checkpoint.save(frontier, visited, leads_seen, pages_visited, leads_saved)
+        raise
+    return pages_visited, leads_saved
+
+def crawl_local_concurrent(
+    frontier: CrawlFrontier,
+    visited: set[str],
+    leads_seen: set[str],
+    max_pages: float,
+    checkpoint: CrawlCheckpoint | None = None,
+    pages_visited: int = 0,
+    leads_saved: int = 0,
+) -> tuple[int, int]:
+    """
+    Local-mode crawl that runs crawl_one on up to CRAWL_CONCURRENCY threads.
+    The frontier keeps at most one URL per domain in flight, so the
+    per-domain politeness delay still holds while distinct domains crawl in
+    parallel. Takes the same checkpoint / starting totals as
+    crawl_local_serial.
+    Returns: (pages_visited, leads_saved)
+    """
+    in_flight = {}
+
+    try:
+        with ThreadPoolExecutor(max_workers=CRAWL_CONCURRENCY) as pool:
+            while True:
+                leads_capped = MAX_LEADS_PER_RUN > 0 and leads_saved >= MAX_LEADS_PER_RUN
+                while (
+                    not leads_capped
+                    and len(in_flight) < CRAWL_CONCURRENCY
+                    and pages_visited + len(in_flight) < max_pages
+                ):
+                    item = frontier.pop_ready()
+                    if not item:
+                        break
+                    url, seed_url, depth = item
+
+                    def enqueue_local(nxt: str, seed: str, depth: int = depth + 1):
+                        frontier.push(nxt, seed, depth)
+
+                    fut = pool.submit(crawl_one, url, seed_url, visited, leads_seen, enqueue_local)
+                    in_flight[fut] = url
+                delay = frontier.next_wait()
+                if not in_flight:
+                    if delay is None or leads_capped or pages_visited >= max_pages:
+                        break
+                    time.sleep(delay)
+                    continue
+                done, _ = wait(list(in_flight), timeout=delay, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    frontier.release(in_flight.pop(fut))
+                    try:
+                        saved, visited_count = fut.result()
+                    except Exception as e:
+                        print(f"Crawl worker failed: {e}")
+                        continue
+                    pages_visited += visited_count
+                    leads_saved += saved
+                if checkpoint:
+                    checkpoint.maybe_save(frontier, visited, leads_seen, pages_visited, leads_saved)
+    except BaseException:
+        # Unfinished pages are still in frontier.in_flight and get re-queued on resume.
+        if checkpoint:
+            checkpoint.save(frontier, visited, leads_seen, pages_visited, leads_saved)
+        raise
+    return pages_visited, leads_saved
+
+def domain_shard(netloc: str, shards: int) -> int:
+    """
+    Jump consistent hash of a normalized netloc onto [0, shards): every
+    page of a domain lands on the same worker process, and going from N to
+    N + 1 processes only moves about 1 / (N + 1) of the domains.
+    """
+    key = lead_fingerprint(netloc)
+    b, j = -1, 0
+    while j < shards:
+        b = j
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        j = int((b + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return b
+
+class ShardControl:
+    """
+    State shared by the QUEUE_MODE=multiproc worker processes: run-wide page
+    and lead totals for MAX_PAGES_PER_RUN / MAX_LEADS_PER_RUN, one inbox per
+    worker for links whose domain belongs to another shard, and the idle
+    flags plus in-transit count that tell when every frontier has drained.
+    A worker only turns busy again by taking a message out of its inbox, so
+    "all idle and nothing in transit" is final.
+    """
+
+    def __init__(self, ctx, shards: int, max_pages: int = 0, max_leads: int = 0):
+        self.shards = shards
+        self.max_pages = max_pages
+        self.max_leads = max_leads
+        self.lock = ctx.Lock()
+        self.pages = ctx.Value("q", 0, lock=False)
+        self.leads = ctx.Value("q", 0, lock=False)
+        self.in_transit = ctx.Value("q", 0, lock=False)
+        self.idle = ctx.Array("b", shards, lock=False)
+        self.inboxes = [ctx.Queue() for _ in range(shards)]
+        self.results = ctx.Queue()
+        self.done = ctx.Event()
+
+    def reserve_page(self) -> bool:
+        """
+        Claims one page of the run budget; False once the run is over.
+        """
+        with self.lock:
+            if self.done.is_set():
+                return False
+            if (self.max_pages > 0 and self.pages.value >= self.max_pages) or (
+                self.max_leads > 0 and self.leads.value >= self.max_leads
+            ):
+                self.done.set()
+                return False
+            self.pages.value += 1
+            return True
+
+    def finish_page(self, pages_visited: int, leads_saved: int):
+        with self.lock:
+            self.pages.value += pages_visited - 1
+            self.leads.value += leads_saved
+
+    def forward(self, shard: int, url: str, seed_url: str, depth: int):
+        with self.lock:
+            self.in_transit.value += 1
+        self.inboxes[shard].put((url, seed_url, depth))
+
+    def receive(self, index: int, timeout: float = 0.0) -> tuple[str, str, int] | None:
+        try:
+            if timeout > 0:
+                item = self.inboxes[index].get(timeout=timeout)
+            else:
+                item = self.inboxes[index].get_nowait()
+        except Empty:
+            return None
+        with self.lock:
+            self.idle[index] = 0
+            self.in_transit.value -= 1
+        return item
+
+    def go_idle(self, index: int) -> bool:
+        """
+        Marks a worker with an empty frontier as idle. Returns True once the
+        whole run is finished.
+        """
+        with self.lock:
+            self.idle[index] = 1
+            if self.in_transit.value == 0 and all(self.idle):
+                self.done.set()
+        return self.done.is_set()
+
+def crawl_shard(index: int, seeds: list[str], control: ShardControl) -> tuple[int, int]:
+    """
+    One QUEUE_MODE=multiproc worker: crawl_local_serial over the domains
+    that hash to `index`, forwarding links for other shards to their inbox.
+    Returns: (pages_visited, leads_saved) for this worker.
+    """
+    frontier = CrawlFrontier()
+    visited = new_url_set()
+    leads_seen = new_url_set()
+    forwarded = new_url_set()
+    for s in seeds:
+        frontier.push(normalize_url(s), s)
+
+    pages_visited = 0
+    leads_saved = 0
+    while not control.done.is_set():
+        while item := control.receive(index):
+            frontier.push(*item)
+        item = frontier.pop_ready()
+        if not item:
+            delay = frontier.next_wait()
+            if delay is None:
+                if control.go_idle(index):
+                    break
+                delay = 0.5
+            if item := control.receive(index, timeout=min(max(delay, 0.01), 0.5)):
+                frontier.push(*item)
+            continue
+        url, seed_url, depth = item
+        if not control.reserve_page():
+            frontier.release(url)
+            break
+
+        def enqueue_shard(nxt: str, seed: str, depth: int = depth + 1):
+            shard = domain_shard(normalize_netloc(urlparse(nxt).netloc), control.shards)
+            if shard == index:
+                frontier.push(nxt, seed, depth)
+            elif nxt not in forwarded:
+                forwarded.add(nxt)
+                control.forward(shard, nxt, seed, depth)
+
+        try:
+            saved, visited_count = crawl_one(url, seed_url, visited, leads_seen, enqueue_shard)
+        finally:
+            frontier.release(url)
+        control.finish_page(visited_count, saved)
+        pages_visited += visited_count
+        leads_saved += saved
+    return pages_visited, leads_saved
+
+def run_shard_process(index: int, seeds: list[str], control: ShardControl):
+    if CONTACT_CACHE_FILE:
+        CONTACT_CACHE.load(CONTACT_CACHE_FILE)
+    if NEGATIVE_CACHE_FILE:
+        NEGATIVE_CACHE.load(NEGATIVE_CACHE_FILE)
+    if SUPPRESSION_INDEX_ENABLED:
+        SUPPRESSION_INDEX.load()
+    pages_visited = 0
+    leads_saved = 0
+    try:
+        pages_visited, leads_saved = crawl_shard(index, seeds, control)
+    except BaseException as e:
+        # Nobody else can drain this shard's inbox, so stop the whole run.
+        print(f"Crawl process {index} failed: {e!r}")
+        control.done.set()
+    finally:
+        PAGE_LOG.close()
+        for inbox in control.inboxes:
+            inbox.cancel_join_thread()
+    control.results.put({
+        "index": index,
+        "pages_visited": pages_visited,
+        "leads_saved": leads_saved,
+        "savings": dict(FETCH_SAVINGS),
+        "negative": dict(NEGATIVE_CACHE.entries),
+        "contact": dict(CONTACT_CACHE.entries),
+        "contact_stats": dict(CONTACT_CACHE.stats),
+    })
+
+def merge_shard_result(result: dict):
+    with STATE_LOCK:
+        for key, amount in result["savings"].items():
+            FETCH_SAVINGS[key] += amount
+    with NEGATIVE_CACHE.lock:
+        NEGATIVE_CACHE.entries.update(result["negative"])
+    with CONTACT_CACHE.lock:
+        CONTACT_CACHE.entries.update(result["contact"])
+        for key, amount in result["contact_stats"].items():
+            CONTACT_CACHE.stats[key] += amount
+
+def crawl_multiproc(seeds: list[str]) -> tuple[int, int]:
+    """
+    QUEUE_MODE=multiproc: CRAWL_PROCESSES worker processes (default: one
+    per core), each owning the domains that domain_shard() maps to it, so
+    parsing runs on every core while DOMAIN_LAST_REQUEST / DOMAIN_PAGES
+    stay local to the process that crawls the domain.
+    Returns: (pages_visited, leads_saved)
+    """
+    shards = CRAWL_PROCESSES if CRAWL_PROCESSES > 0 else (os.cpu_count() or 1)
+    ctx = multiprocessing.get_context("spawn")
+    control = ShardControl(ctx, shards, MAX_PAGES_PER_RUN, MAX_LEADS_PER_RUN)
+    by_shard: list[list[str]] = [[] for _ in range(shards)]
+    for s in seeds:
+        u = normalize_url(s)
+        if u:
+            by_shard[domain_shard(normalize_netloc(urlparse(u).netloc), shards)].append(s)
+
+    procs = [
+        ctx.Process(target=run_shard_process, args=(i, by_shard[i], control), name=f"leadbot-shard-{i}")
+        for i in range(shards)
+    ]
+    for p in procs:
+        p.start()
+    print(f"Crawling with {shards} processes.")
+
+    pages_visited = 0
+    leads_saved = 0
+    reported = 0
+    while reported < shards:
+        try:
+            result = control.results.get(timeout=1.0)
+        except Empty:
+            if not any(p.is_alive() for p in procs):
+                break
+            continue
+        reported += 1
+        pages_visited += result["pages_visited"]
+        leads_saved += result["leads_saved"]
+        merge_shard_result(result)
+    for p in procs:
+        p.join()
+    return pages_visited, leads_saved
+
+def crawl_sqs_message(
+    sqs: SqsQueue,
+    msg: dict,
+    visited: set[str],
+    leads_seen: set[str],
+) -> tuple[int, int]:
+    """
+    Returns: (leads_saved, pages_visited) for one SQS message.
+    """
+    try:
+        payload = json.loads(msg.get("Body") or "")
+    except Exception:
+        return 0, 0
+    url = normalize_url(payload.get("url", ""))
+    seed_url = payload.get("seed_url") or url
+    if not url:
+        return 0, 0
+
+    def enqueue_worker(nxt: str, seed: str):
+        if should_skip_cached(nxt):
+            return
+        sqs.send(nxt, seed)
+
+    return crawl_one(url, seed_url, visited, leads_seen, enqueue_worker, prime_visited_cache=True)
+
+def crawl_sqs_worker(
+    sqs: SqsQueue,
+    visited: set[str],
+    leads_seen: set[str],
+    max_pages: float,
+) -> tuple[int, int]:
+    """
+    Worker-mode loop. The next receive_message call runs in the background
+    while the current batch is crawled, messages in a batch are crawled on
+    up to CRAWL_CONCURRENCY threads, and deletes/sends go out in batches.
+    Returns: (pages_visited, leads_saved)
+    """
+    pages_visited = 0
+    leads_saved = 0
+    idle_rounds = 0
+    workers = max(1, CRAWL_CONCURRENCY)
+    heartbeat = VisibilityHeartbeat(sqs)
+    heartbeat.start()
+
+    def receive() -> list[dict]:
+        return heartbeat.track(sqs.receive())
+
+    pending = None
+    try:
+        with ThreadPoolExecutor(max_workers=1) as receiver, ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = receiver.submit(receive)
+            while pages_visited < max_pages:
+                try:
+                    msgs = pending.result()
+                except Exception as e:
+                    print(f"SQS receive failed: {e}")
+                    msgs = []
+                pending = None
+                if not msgs:
+                    idle_rounds += 1
+                    if idle_rounds >= 3:
+                        break
+                    pending = receiver.submit(receive)
+                    continue
+                idle_rounds = 0
+                if pages_visited + len(msgs) < max_pages:
+                    pending = receiver.submit(receive)
+
+                futures = [pool.submit(crawl_sqs_message, sqs, msg, visited, leads_seen) for msg in msgs]
+                done = []
+                for msg, fut in zip(msgs, futures):
+                    receipt = msg.get("ReceiptHandle")
+                    try:
+                        saved, visited_count = fut.result()
+                    except Exception as e:
+                        print(f"Crawl worker failed: {e}")
+                        if receipt:
+                            heartbeat.finish(receipt)
+                        continue
+                    pages_visited += visited_count
+                    leads_saved += saved
+                    if receipt:
+                        heartbeat.finish(receipt)
+                        done.append(receipt)
+                sqs.delete_batch(done)
+                sqs.flush()
+                if pending is None:
+                    break
+            if pending is not None and not pending.cancel():
+                # Wait for the in-flight prefetch so its messages get released below.
+                try:
+                    pending.result()
+                except Exception:
+                    pass
+    finally:
+        # Anything still tracked was received but not crawled (prefetched or
+        # failed); hand it back now instead of after the visibility timeout.
+        heartbeat.stop()
+        sqs.flush()
+    print(heartbeat.summary())
+    if pages_visited:
+        print(f"SQS: {sqs.requests} requests for {pages_visited} pages ({sqs.requests / pages_visited:.1f}/page)")
+    return pages_visited, leads_saved
+
+def finish_run(pages_visited: int, leads_saved: int):
+    PAGE_LOG.close()
+    if CONTACT_CACHE_FILE:
+        CONTACT_CACHE.save(CONTACT_CACHE_FILE)
+    if NEGATIVE_CACHE_FILE:
+        NEGATIVE_CACHE.save(NEGATIVE_CACHE_FILE)
+    print(f"Done. Visited {pages_visited} pages. Saved {leads_saved} leads.")
+    print(savings_summary())
+    if RATE_ADAPTIVE:
+        print(RATE_CONTROL.summary())
+    print(
+        f"Contact cache: {CONTACT_CACHE.stats['resolved']} domains resolved, "
+        f"{CONTACT_CACHE.stats['hits']} lookups served from cache."
+    )
+    if PAGE_LOG_WRITE_BEHIND:
+        print(PAGE_LOG.summary())
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Crawl seed sites for music licensing leads.")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"local mode: continue the interrupted run saved in CHECKPOINT_FILE ({CHECKPOINT_FILE})",
+    )
+    return parser.parse_args(argv)
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+    checkpoint = CrawlCheckpoint(CHECKPOINT_FILE, CHECKPOINT_EVERY_PAGES) if CHECKPOINT_FILE else None
+    resume_state = None
+    if args.resume:
+        if QUEUE_MODE == "multiproc" or (queue_enabled() and QUEUE_MODE != "local"):
+            print("--resume only applies to QUEUE_MODE=local; ignoring.")
+        elif not checkpoint:
+            print("--resume needs CHECKPOINT_FILE; starting from seeds.")
+        else:
+            resume_state = checkpoint.load()
+            if resume_state is None:
+                print(f"No checkpoint at {CHECKPOINT_FILE}; starting from seeds.")
+
+    seeds = []
+    if resume_state is None:
+        seeds = load_seeds("seeds.txt")
+        discovered = discover_seed_urls()
+        if discovered:
+            seed_set = {normalize_url(s) for s in seeds if s}
+            for u in discovered:
+                nu = normalize_url(u)
+                if not nu:
+                    continue
+                if nu not in seed_set:
+                    seeds.append(nu)
+                    seed_set.add(nu)
+        if not seeds:
+            return
 
     if queue_enabled() and QUEUE_MODE == "producer":
         sqs = SqsQueue(SQS_QUEUE_URL)
@@ -1142,71 +2918,60 @@ def main():
                 continue
             sqs.send(u, s)
             sent += 1
+        sqs.flush()
         print(f"Queued {sent} seed urls to SQS.")
         return
 
-    queue: list[tuple[str, str]] = []
+    if CONTACT_CACHE_FILE:
+        CONTACT_CACHE.load(CONTACT_CACHE_FILE)
+    if NEGATIVE_CACHE_FILE:
+        NEGATIVE_CACHE.load(NEGATIVE_CACHE_FILE)
+    if SUPPRESSION_INDEX_ENABLED:
+        if SUPPRESSION_INDEX.load():
+            print(f"Suppression index loaded: {len(SUPPRESSION_INDEX.fingerprints)} leads")
+
+    if QUEUE_MODE == "multiproc":
+        pages_visited, leads_saved = crawl_multiproc(seeds)
+        finish_run(pages_visited, leads_saved)
+        return
+
+    frontier = CrawlFrontier()
     for s in seeds:
-        queue.append((normalize_url(s), s))
+        frontier.push(normalize_url(s), s)
 
-    visited = set()
+    visited = new_url_set()
     pages_visited = 0
     leads_saved = 0
-    leads_seen = set()
+    leads_seen = new_url_set()
 
     max_pages_per_run = MAX_PAGES_PER_RUN if MAX_PAGES_PER_RUN > 0 else float("inf")
     if queue_enabled() and QUEUE_MODE == "worker":
         sqs = SqsQueue(SQS_QUEUE_URL)
-        idle_rounds = 0
-        while pages_visited < max_pages_per_run:
-            msgs = sqs.receive()
-            if not msgs:
-                idle_rounds += 1
-                if idle_rounds >= 3:
-                    break
-                continue
-            idle_rounds = 0
-            for msg in msgs:
-                body = msg.get("Body") or ""
-                receipt = msg.get("ReceiptHandle")
-                try:
-                    payload = json.loads(body)
-                except Exception:
-                    if receipt:
-                        sqs.delete(receipt)
-                    continue
-                url = normalize_url(payload.get("url", ""))
-                seed_url = payload.get("seed_url") or url
-                if not url:
-                    if receipt:
-                        sqs.delete(receipt)
-                    continue
-
-                def enqueue_worker(nxt: str, seed: str):
-                    if should_skip_cached(nxt):
-                        return
-                    sqs.send(nxt, seed)
-
-                saved, visited_count = crawl_one(url, seed_url, visited, leads_seen, enqueue_worker)
-                pages_visited += visited_count
-                leads_saved += saved
-                if receipt:
-                    sqs.delete(receipt)
-        print(f"Done. Visited {pages_visited} pages. Saved {leads_saved} leads.")
+        pages_visited, leads_saved = crawl_sqs_worker(sqs, visited, leads_seen, max_pages_per_run)
+        finish_run(pages_visited, leads_saved)
         return
 
-    while queue and pages_visited < max_pages_per_run:
-        if MAX_LEADS_PER_RUN > 0 and leads_saved >= MAX_LEADS_PER_RUN:
-            break
-        url, seed_url = queue.pop(0)
-        def enqueue_local(nxt: str, seed: str):
-            queue.append((nxt, seed))
-
-        saved, visited_count = crawl_one(url, seed_url, visited, leads_seen, enqueue_local)
-        pages_visited += visited_count
-        leads_saved += saved
+    if resume_state is not None:
+        pages_visited, leads_saved = checkpoint.restore(resume_state, frontier, visited, leads_seen)
+        print(
+            f"Resumed from {CHECKPOINT_FILE}: {pages_visited} pages visited, "
+            f"{leads_saved} leads saved, {len(frontier)} urls queued."
+        )
 
-    print(f"Done. Visited {pages_visited} pages. Saved {leads_saved} leads.")
+    crawl_local = crawl_local_concurrent if CRAWL_CONCURRENCY > 1 else crawl_local_serial
+    try:
+        pages_visited, leads_saved = crawl_local(
+            frontier, visited, leads_seen, max_pages_per_run, checkpoint, pages_visited, leads_saved
+        )
+    except KeyboardInterrupt:
+        if checkpoint:
+            print(f"Interrupted. Crawl state saved to {CHECKPOINT_FILE}; continue with: python run.py --resume")
+            return
+        raise
+    if checkpoint:
+        checkpoint.clear()
+
+    finish_run(pages_visited, leads_saved)
 
 if __name__ == "__main__":
     main()
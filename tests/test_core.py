@@ -1,3 +1,6 @@
+import json
+import time
+
 import run
 
 
@@ -21,4 +24,460 @@ def test_library_confidence_basics():
     headings = "Library Music Catalog"
     body = "Royalty-free music library with a large catalog"
     score = run.library_confidence(title, headings, body, "https://example.com/library")
-    assert score >= 60
\ No newline at end of file
+    assert score >= 60
+
+def test_crawl_local_concurrent_crawls_every_domain(monkeypatch):
+    pages = {
+        "https://a.test/": '<a href="/one">one</a>',
+        "https://a.test/one": "<p>one</p>",
+        "https://b.test/": "<p>b</p>",
+        "https://c.test/": "<p>c</p>",
+    }
+    monkeypatch.setattr(run, "CRAWL_CONCURRENCY", 3)
+    monkeypatch.setattr(run, "fetch", lambda u: pages.get(u))
+    monkeypatch.setattr(run, "SLEEP_BETWEEN_REQUESTS", 0.0)
+    frontier = run.CrawlFrontier()
+    for u in ("https://a.test/", "https://b.test/", "https://c.test/"):
+        frontier.push(u, u)
+    visited = set()
+    pages_visited, leads_saved = run.crawl_local_concurrent(frontier, visited, set(), float("inf"))
+    assert pages_visited == 4
+    assert leads_saved == 0
+    assert visited == set(pages)
+
+
+def test_frontier_hands_out_ready_domains_first(monkeypatch):
+    monkeypatch.setattr(run, "SLEEP_BETWEEN_REQUESTS", 2.0)
+    monkeypatch.setattr(run, "DOMAIN_LAST_REQUEST", {"a.test": 100.0})
+    frontier = run.CrawlFrontier()
+    frontier.push("https://a.test/x", "https://a.test/")
+    frontier.push("https://b.test/y", "https://b.test/")
+    assert frontier.pop_ready(now=101.0) == ("https://b.test/y", "https://b.test/", 0)
+    assert frontier.pop_ready(now=101.0) is None
+    assert frontier.next_wait(now=101.0) == 1.0
+    assert frontier.pop_ready(now=102.0) == ("https://a.test/x", "https://a.test/", 0)
+
+
+def test_frontier_prefers_high_value_links_and_dedupes(monkeypatch):
+    monkeypatch.setattr(run, "SLEEP_BETWEEN_REQUESTS", 0.0)
+    monkeypatch.setattr(run, "DOMAIN_LAST_REQUEST", {})
+    frontier = run.CrawlFrontier()
+    seed = "https://a.test/"
+    assert frontier.push("https://a.test/gallery", seed, 1)
+    assert frontier.push("https://a.test/licensing/contact", seed, 3)
+    assert not frontier.push("https://a.test/gallery", seed, 1)
+    url, _, depth = frontier.pop_ready(now=1.0)
+    assert (url, depth) == ("https://a.test/licensing/contact", 3)
+    frontier.release(url)
+    assert frontier.pop_ready(now=1.0)[0] == "https://a.test/gallery"
+    assert len(frontier) == 0
+
+
+def test_page_model_collects_contact_signals():
+    html = (
+        "<html><head><title>Sync Library</title></head><body>"
+        "<h1>Licensing</h1><a href='mailto:Hello@Lib.test?subject=hi'>mail</a>"
+        "<a href='/contact'>Contact</a><p>info&#64;lib.test</p></body></html>"
+    )
+    page = run.PageModel("https://lib.test/", html)
+    assert page.title == "Sync Library"
+    assert page.headings == "Licensing"
+    assert page.mailtos == ["hello@lib.test"]
+    assert page.emails == ["hello@lib.test", "info@lib.test"]
+    assert run.pick_contact_link(page) == "https://lib.test/contact"
+    assert run.extract_links(page, "lib.test") == ["https://lib.test/contact"]
+
+
+def test_visited_cache_primes_with_one_batch_call(monkeypatch):
+    calls = []
+
+    class FakeDynamo:
+        def batch_get_item(self, RequestItems):
+            keys = RequestItems[run.VISITED_CACHE_TABLE]["Keys"]
+            calls.append(len(keys))
+            return {
+                "Responses": {run.VISITED_CACHE_TABLE: [{"page_url": "https://a.test/seen"}]},
+                "UnprocessedKeys": {},
+            }
+
+    class NoGets:
+        def get_item(self, **kwargs):
+            raise AssertionError("should be answered from the LRU")
+
+    monkeypatch.setattr(run, "VISITED_CACHE_ENABLED", True)
+    monkeypatch.setattr(run, "VISITED_CACHE_TTL_HOURS", 0)
+    monkeypatch.setattr(run, "dynamodb", FakeDynamo())
+    monkeypatch.setattr(run, "visited_table", NoGets())
+    cache = run.VisitedCache()
+    cache.prime(["https://a.test/seen", "https://a.test/new", "https://a.test/seen"])
+    assert calls == [2]
+    assert cache.should_skip("https://a.test/seen")
+    assert not cache.should_skip("https://a.test/new")
+    cache.record({"page_url": "https://a.test/new", "last_crawled": run.now_iso()})
+    assert cache.should_skip("https://a.test/new")
+
+
+def test_page_log_buffer_flushes_in_batches(monkeypatch):
+    written = []
+
+    class FakeWriter:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def put_item(self, Item):
+            written.append(Item["page_url"])
+
+    class FakeTable:
+        def batch_writer(self, overwrite_by_pkeys=None):
+            return FakeWriter()
+
+    monkeypatch.setattr(run, "pages_table", FakeTable())
+    monkeypatch.setattr(run, "PAGE_LOG_BATCH_SIZE", 2)
+    log = run.PageLogBuffer()
+    for i in range(5):
+        log.add({"page_url": f"https://a.test/{i}", "last_crawled": run.now_iso()})
+    log.close()
+    assert sorted(written) == [f"https://a.test/{i}" for i in range(5)]
+    assert log.stats["written"] == 5
+    assert log.stats["dropped"] == 0
+
+
+def test_suppression_index_only_confirms_possible_positives(monkeypatch):
+    contacted_domain = run.sha_id("domain:taken.test")
+
+    class FakeLeads:
+        def scan(self, **kwargs):
+            if kwargs["Segment"] == 0:
+                return {"Items": [{"lead_id": "skipped-lead"}, {"lead_id": contacted_domain}]}
+            return {"Items": []}
+
+    lookups = []
+    monkeypatch.setattr(run, "leads_table", FakeLeads())
+    monkeypatch.setattr(run, "SKIP_CONTACTED_DOMAINS", True)
+    monkeypatch.setattr(run, "lookup_lead_skipped", lambda *a: lookups.append(a) or True)
+    index = run.SuppressionIndex()
+    assert index.load()
+    monkeypatch.setattr(run, "SUPPRESSION_INDEX", index)
+    assert not run.is_lead_skipped("fresh-lead", "new.test")
+    assert lookups == []
+    assert run.is_lead_skipped("skipped-lead", "new.test")
+    assert run.is_lead_skipped("other-lead", "taken.test")
+    assert len(lookups) == 2
+
+
+class FakeSqsClient:
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.calls = []
+        self.sent = []
+        self.deleted = []
+
+    def receive_message(self, **kwargs):
+        self.calls.append("receive")
+        return {"Messages": self.batches.pop(0) if self.batches else []}
+
+    def send_message_batch(self, QueueUrl, Entries):
+        self.calls.append("send")
+        self.sent.extend(Entries)
+        return {"Successful": Entries, "Failed": []}
+
+    def delete_message_batch(self, QueueUrl, Entries):
+        self.calls.append("delete")
+        self.deleted.extend(e["ReceiptHandle"] for e in Entries)
+        return {"Successful": Entries, "Failed": []}
+
+    def change_message_visibility_batch(self, QueueUrl, Entries):
+        self.calls.append(("visibility", tuple((e["ReceiptHandle"], e["VisibilityTimeout"]) for e in Entries)))
+        return {"Successful": Entries, "Failed": []}
+
+
+def test_sqs_worker_batches_sends_and_deletes(monkeypatch):
+    html = "<p>x</p>" + "".join(f'<a href="/p{i}">p</a>' for i in range(15))
+    monkeypatch.setattr(run, "fetch", lambda u: html if u.endswith(".test/") else None)
+    monkeypatch.setattr(run, "should_skip_cached", lambda u: False)
+    monkeypatch.setattr(run.VISITED_CACHE, "prime", lambda urls: None)
+    monkeypatch.setattr(run, "SQS_WAIT_SECONDS", 0)
+    msgs = [
+        {"Body": json.dumps({"url": f"https://s{i}.test/", "seed_url": f"https://s{i}.test/"}), "ReceiptHandle": f"r{i}"}
+        for i in range(3)
+    ]
+    sqs = run.SqsQueue("https://sqs.test/queue")
+    sqs.client = FakeSqsClient([msgs])
+    pages, leads = run.crawl_sqs_worker(sqs, set(), set(), float("inf"))
+    assert pages == 3
+    assert sorted(sqs.client.deleted) == ["r0", "r1", "r2"]
+    assert len(sqs.client.sent) == 45
+    assert sqs.client.calls.count("send") == 5
+    assert sqs.client.calls.count("delete") == 1
+
+
+def test_visibility_heartbeat_extends_then_releases(monkeypatch):
+    monkeypatch.setattr(run, "SQS_HEARTBEAT_SECONDS", 0.01)
+    monkeypatch.setattr(run, "SQS_VISIBILITY_TIMEOUT", 30)
+    sqs = run.SqsQueue("https://sqs.test/queue")
+    sqs.client = FakeSqsClient([])
+    heartbeat = run.VisibilityHeartbeat(sqs)
+    heartbeat.track([{"ReceiptHandle": "busy"}, {"ReceiptHandle": "prefetched"}])
+    heartbeat.start()
+    time.sleep(0.05)
+    heartbeat.finish("busy")
+    heartbeat.stop()
+    visibility = [c[1] for c in sqs.client.calls if c[0] == "visibility"]
+    assert (("busy", 30), ("prefetched", 30)) in visibility
+    assert visibility[-1] == (("prefetched", 0),)
+    assert heartbeat.stats["released"] == 1
+
+
+def test_detect_contact_probes_each_domain_once(monkeypatch):
+    fetched = []
+
+    def fake_fetch(u):
+        fetched.append(u)
+        return "<p>Write to hello@lib.test</p>" if u.endswith("/about") else None
+
+    monkeypatch.setattr(run, "fetch", fake_fetch)
+    monkeypatch.setattr(run, "CONTACT_CACHE", run.ContactCache())
+    first = run.detect_contact(run.PageModel("https://lib.test/a", "<p>a</p>"))
+    second = run.detect_contact(run.PageModel("https://lib.test/b", "<p>b</p>"))
+    assert first == second == ("email", "hello@lib.test", "https://lib.test/about")
+    assert fetched == ["https://lib.test/contact", "https://lib.test/contact-us", "https://lib.test/about"]
+
+
+def test_parallel_contact_probe_keeps_path_order(monkeypatch):
+    hits = {"https://lib.test/team", "https://lib.test/booking"}
+    monkeypatch.setattr(run, "CONTACT_PROBE_CONCURRENCY", 4)
+    monkeypatch.setattr(run, "fetch", lambda u: "<p>team</p>" if u in hits else None)
+    assert run.probe_contact_paths("https://lib.test") == ("form", None, "https://lib.test/team")
+
+
+class FakeResponse:
+    def __init__(self, status_code, text="", headers=None):
+        self.status_code = status_code
+        self.content = text.encode("utf-8")
+        self.headers = headers or {}
+        self.encoding = "utf-8"
+        self.read = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            self.read += chunk_size
+            yield self.content[i:i + chunk_size]
+
+
+def test_fetch_skips_known_404s_and_dead_domains(monkeypatch):
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        if "dead.test" in url:
+            raise run.requests.exceptions.ConnectTimeout("timed out")
+        return FakeResponse(404)
+
+    monkeypatch.setattr(run.session, "get", fake_get)
+    monkeypatch.setattr(run, "safe_put_pages", lambda item: None)
+    monkeypatch.setattr(run, "should_skip_cached", lambda u: False)
+    monkeypatch.setattr(run, "SLEEP_BETWEEN_REQUESTS", 0.0)
+    monkeypatch.setattr(run, "RATE_ADAPTIVE", False)
+    monkeypatch.setattr(run, "MAX_PAGES_PER_DOMAIN", 0)
+    monkeypatch.setattr(run, "CIRCUIT_BREAKER_FAILURES", 2)
+    monkeypatch.setattr(run, "NEGATIVE_CACHE", run.NegativeCache())
+    monkeypatch.setattr(run, "CIRCUIT_BREAKER", run.CircuitBreaker())
+    assert run.fetch("https://lib.test/contact") is None
+    assert run.fetch("https://lib.test/contact") is None
+    for i in range(4):
+        assert run.fetch(f"https://dead.test/{i}") is None
+    assert calls == ["https://lib.test/contact", "https://dead.test/0", "https://dead.test/1"]
+    assert run.CIRCUIT_BREAKER.is_open("dead.test")
+
+
+def test_fetch_recrawl_is_conditional(monkeypatch):
+    sent_headers = []
+    responses = [
+        FakeResponse(200, "<p>v1</p>", {"ETag": '"abc"', "Last-Modified": "Mon, 05 Oct 2026 10:00:00 GMT"}),
+        FakeResponse(304),
+    ]
+
+    def fake_get(url, headers=None, **kwargs):
+        sent_headers.append(headers)
+        return responses.pop(0)
+
+    written = []
+    cache = run.VisitedCache()
+    monkeypatch.setattr(run.session, "get", fake_get)
+    monkeypatch.setattr(run, "VISITED_CACHE", cache)
+    monkeypatch.setattr(run, "PAGE_LOG_WRITE_BEHIND", False)
+    monkeypatch.setattr(run.pages_table, "put_item", lambda Item: written.append(Item))
+    monkeypatch.setattr(run, "should_skip_cached", lambda u: False)
+    monkeypatch.setattr(run, "SLEEP_BETWEEN_REQUESTS", 0.0)
+    monkeypatch.setattr(run, "RATE_ADAPTIVE", False)
+    monkeypatch.setattr(run, "MAX_PAGES_PER_DOMAIN", 0)
+    monkeypatch.setattr(run, "VISITED_CACHE_TTL_HOURS", 1)
+
+    assert run.fetch("https://lib.test/") == "<p>v1</p>"
+    stale = dict(written[-1], last_crawled="2026-01-01T00:00:00+00:00")
+    cache.record(stale)
+    assert run.fetch("https://lib.test/") is None
+    assert sent_headers == [
+        None,
+        {"If-None-Match": '"abc"', "If-Modified-Since": "Mon, 05 Oct 2026 10:00:00 GMT"},
+    ]
+    assert written[-1]["status_code"] == 304
+    assert written[-1]["etag"] == '"abc"'
+
+
+def test_fetch_streams_with_type_gate_and_byte_cap(monkeypatch):
+    big = FakeResponse(200, "<p>" + "x" * 100000 + "</p>", {"Content-Type": "text/html; charset=utf-8"})
+    audio = FakeResponse(200, "ID3" + "\0" * 1000, {"Content-Type": "audio/mpeg"})
+    responses = {"https://lib.test/big": big, "https://lib.test/song": audio}
+    monkeypatch.setattr(run.session, "get", lambda url, **kwargs: responses[url])
+    monkeypatch.setattr(run, "safe_put_pages", lambda item: None)
+    monkeypatch.setattr(run, "should_skip_cached", lambda u: False)
+    monkeypatch.setattr(run, "SLEEP_BETWEEN_REQUESTS", 0.0)
+    monkeypatch.setattr(run, "RATE_ADAPTIVE", False)
+    monkeypatch.setattr(run, "MAX_PAGES_PER_DOMAIN", 0)
+    monkeypatch.setattr(run, "MAX_PAGE_BYTES", 20000)
+    assert run.fetch("https://lib.test/song") is None
+    assert audio.read == 0
+    html = run.fetch("https://lib.test/big")
+    assert len(html) == 20000
+    assert big.read < 40000
+
+
+def test_rate_controller_speeds_up_and_backs_off(monkeypatch):
+    monkeypatch.setattr(run, "RATE_ADAPTIVE", True)
+    monkeypatch.setattr(run, "SLEEP_BETWEEN_REQUESTS", 2.0)
+    monkeypatch.setattr(run, "RATE_MIN_DELAY", 1.0)
+    monkeypatch.setattr(run, "RATE_MAX_DELAY", 30.0)
+    rc = run.DomainRateController()
+    for _ in range(10):
+        rc.observe("fast.test", 200, 0.1)
+    assert rc.delay("fast.test") == 1.0
+    rc.observe("busy.test", 429, 0.1, "20")
+    assert rc.delay("busy.test") == 4.0
+    assert rc.next_slot("busy.test", 0.0) >= run.time.time() + 19
+    rc.observe("slow.test", 200, 10.0)
+    assert rc.delay("slow.test") == 4.0
+    assert rc.throttles == {"busy.test": 1, "slow.test": 1}
+
+
+def test_checkpoint_resume_after_interrupt(monkeypatch, tmp_path):
+    pages = {
+        "https://a.test/": '<a href="/one">one</a><a href="/two">two</a>',
+        "https://a.test/one": "<p>one</p>",
+        "https://a.test/two": "<p>two</p>",
+    }
+    crawled = []
+    real_crawl_one = run.crawl_one
+
+    def crawl_one(url, seed_url, visited, leads_seen, enqueue_fn):
+        if len(crawled) == 1:
+            real_crawl_one(url, seed_url, visited, leads_seen, lambda *a: None)
+            raise KeyboardInterrupt
+        crawled.append(url)
+        return real_crawl_one(url, seed_url, visited, leads_seen, enqueue_fn)
+
+    monkeypatch.setattr(run, "fetch", lambda u: pages.get(u))
+    monkeypatch.setattr(run, "SLEEP_BETWEEN_REQUESTS", 0.0)
+    monkeypatch.setattr(run, "RATE_ADAPTIVE", False)
+    monkeypatch.setattr(run, "DOMAIN_PAGES", {"a.test": 1})
+    monkeypatch.setattr(run, "DOMAIN_LAST_REQUEST", {})
+    monkeypatch.setattr(run, "crawl_one", crawl_one)
+    checkpoint = run.CrawlCheckpoint(str(tmp_path / "checkpoint.json"))
+    frontier = run.CrawlFrontier()
+    frontier.push("https://a.test/", "https://a.test/")
+    visited = set()
+    try:
+        run.crawl_local_serial(frontier, visited, set(), float("inf"), checkpoint)
+    except KeyboardInterrupt:
+        pass
+    assert crawled == ["https://a.test/"]
+    assert checkpoint.saves == 1
+
+    monkeypatch.setattr(run, "DOMAIN_PAGES", {})
+    monkeypatch.setattr(run, "DOMAIN_LAST_REQUEST", {})
+    resumed = run.CrawlFrontier()
+    visited = set()
+    data = run.CrawlCheckpoint(checkpoint.path).load()
+    assert checkpoint.restore(data, resumed, visited, set()) == (1, 0)
+    # The page that was in flight when the run stopped is not marked visited.
+    assert visited == {"https://a.test/"}
+    assert run.DOMAIN_PAGES == {"a.test": 1}
+    assert len(resumed) == 2
+    assert not resumed.push("https://a.test/one", "https://a.test/")
+    monkeypatch.setattr(run, "crawl_one", real_crawl_one)
+    assert run.crawl_local_serial(resumed, visited, set(), float("inf"), None, 1, 0) == (3, 0)
+    assert visited == set(pages)
+
+
+def test_fingerprint_set_grows_and_round_trips():
+    urls = [f"https://a.test/page/{i}" for i in range(5000)]
+    fps = run.FingerprintSet(urls[:4000])
+    fps.update(urls[:10])
+    assert len(fps) == 4000
+    assert all(u in fps for u in urls[:4000])
+    assert not any(u in fps for u in urls[4000:])
+
+    restored = run.FingerprintSet()
+    run.load_url_set(restored, run.dump_url_set(fps, exclude={urls[0]}))
+    assert len(restored) == 3999
+    assert urls[0] not in restored and urls[1] in restored
+    plain = set()
+    run.load_url_set(plain, run.dump_url_set({"https://b.test/"}))
+    assert plain == {"https://b.test/"}
+
+
+def test_domain_shard_is_consistent():
+    domains = [f"library{i}.test" for i in range(2000)]
+    four = [run.domain_shard(d, 4) for d in domains]
+    five = [run.domain_shard(d, 5) for d in domains]
+    assert set(four) == {0, 1, 2, 3}
+    assert all(b == a or b == 4 for a, b in zip(four, five))
+    assert 300 < five.count(4) < 500
+
+
+def test_crawl_shards_forward_links_and_share_budget(monkeypatch):
+    import multiprocessing
+    import threading
+
+    pages = {
+        "https://a.test/": '<a href="https://b.test/from-a">b</a><a href="/one">one</a>',
+        "https://a.test/one": "<p>one</p>",
+        "https://b.test/": "<p>b</p>",
+        "https://b.test/from-a": "<p>from a</p>",
+    }
+    assert run.domain_shard("a.test", 2) != run.domain_shard("b.test", 2)
+    monkeypatch.setattr(run, "fetch", lambda u: pages.get(u))
+    monkeypatch.setattr(run, "ALLOW_EXTERNAL_DOMAINS", True)
+    monkeypatch.setattr(run, "DOMAIN_LAST_REQUEST", {})
+    monkeypatch.setattr(run, "DOMAIN_PAGES", {})
+
+    def run_shards(max_pages):
+        control = run.ShardControl(multiprocessing.get_context("spawn"), 2, max_pages)
+        results = [None, None]
+        seeds = {run.domain_shard("a.test", 2): ["https://a.test/"], run.domain_shard("b.test", 2): ["https://b.test/"]}
+
+        def work(i):
+            results[i] = run.crawl_shard(i, seeds[i], control)
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+        assert control.done.is_set()
+        return results, control.pages.value
+
+    results, total = run_shards(0)
+    assert total == 4
+    assert sum(r[0] for r in results) == 4
+    results, total = run_shards(2)
+    assert total == 2
@@ -0,0 +1,29 @@
+import socket
+
+import http_transport
+
+
+def test_dns_cache_reuses_answers(monkeypatch):
+    lookups = []
+
+    def fake_getaddrinfo(host, port, *args):
+        lookups.append(host)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port))]
+
+    monkeypatch.setattr(http_transport, "_real_getaddrinfo", fake_getaddrinfo)
+    monkeypatch.setattr(http_transport, "_dns_ttl", 60.0)
+    http_transport.clear_dns_cache()
+    first = http_transport._cached_getaddrinfo("lib.test", 443)
+    second = http_transport._cached_getaddrinfo("lib.test", 443)
+    assert first == second
+    assert lookups == ["lib.test"]
+
+
+def test_build_session_pools_and_retries():
+    session = http_transport.build_session("UA/1.0", pool_hosts=4, pool_per_host=16, retries=3)
+    adapter = session.get_adapter("https://lib.test/")
+    assert adapter._pool_maxsize == 16
+    assert adapter.max_retries.connect == 3
+    assert adapter.max_retries.read == 0
+    assert session.headers["User-Agent"] == "UA/1.0"
+    assert "gzip" in session.headers["Accept-Encoding"]
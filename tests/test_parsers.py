@@ -0,0 +1,35 @@
+import pathlib
+
+import pytest
+
+import run
+
+PAGES = sorted((pathlib.Path(__file__).parent / "fixtures" / "pages").glob("*.html"))
+BACKENDS = [name for name in run.PARSER_BACKENDS if name != "html.parser"]
+
+
+def extracted(url: str, html: str, parser: str) -> dict:
+    page = run.PageModel(url, html, parser=parser)
+    return {
+        "title": page.title,
+        "headings": page.headings,
+        "emails": page.emails,
+        "contact_link": run.pick_contact_link(page),
+        "links": run.extract_links(page, "northlightmusic.test"),
+        "role": run.detect_role(page.title, page.headings, page.body, url),
+        "library_confidence": run.library_confidence(page.title, page.headings, page.body, url),
+    }
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("path", PAGES, ids=lambda p: p.stem)
+def test_backends_extract_identical_leads(backend, path):
+    if not run.parser_available(backend):
+        pytest.skip(f"{backend} not installed")
+    url = "https://northlightmusic.test/" + path.stem
+    html = path.read_text(encoding="utf-8")
+    assert extracted(url, html, backend) == extracted(url, html, "html.parser")
+
+
+def test_unknown_parser_falls_back_to_html_parser():
+    assert run.resolve_html_parser("nope") == "html.parser"
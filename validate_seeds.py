@@ -2,12 +2,17 @@ import socket
 import requests
 from urllib.parse import urlparse
 
+from http_transport import build_session, install_dns_cache
+
 IN_FILE = "seeds.txt"
 OUT_OK = "seeds_working.txt"
 OUT_BAD = "seeds_failed.txt"
 
 TIMEOUT = 12
 
+install_dns_cache(300)
+session = build_session("StudioLeadbot/1.0")
+
 def can_resolve(host: str) -> bool:
     try:
         socket.getaddrinfo(host, 443)
@@ -25,11 +30,10 @@ def check_url(url: str) -> tuple[bool, str]:
             return False, "dns_fail"
 
         try:
-            r = requests.head(
+            r = session.head(
                 url,
                 allow_redirects=True,
                 timeout=TIMEOUT,
-                headers={"User-Agent": "StudioLeadbot/1.0"}
             )
             if r.status_code < 400:
                 return True, f"ok_{r.status_code}"
@@ -38,11 +42,10 @@ def check_url(url: str) -> tuple[bool, str]:
         except requests.exceptions.RequestException:
             pass
 
-        r = requests.get(
+        r = session.get(
             url,
             allow_redirects=True,
             timeout=TIMEOUT,
-            headers={"User-Agent": "StudioLeadbot/1.0"},
             stream=True,
         )
         r.close()